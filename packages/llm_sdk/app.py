@@ -4,10 +4,8 @@ from llm_sdk import SyncLLM
 from llm_sdk.providers.sync_registry import ProviderSpec
 from llm_sdk.providers.noop_client import NoopLLMClient
 
-Logger().configure()
-logger = Logger()
 
-def main_sync() -> None:
+def main_sync(logger: Logger) -> None:
     sdk = SyncLLM.default(logger=logger)
 
     sdk.registry.register(ProviderSpec(
@@ -17,7 +15,7 @@ def main_sync() -> None:
     ))
 
     resp = sdk.chat(
-        messages=[{"model", "Eres un profesor"}, ("user", "Hola, ¿Cómo estás?")],
+        messages=[("system", "Eres un profesor"), ("user", "Hola, ¿Cómo estás?")],
         provider="noop",
         model="noop",
     )
@@ -26,4 +24,6 @@ def main_sync() -> None:
 
 
 if __name__ == "__main__":
-    main_sync()
\ No newline at end of file
+    # Configure logging only when run as a script, never on import.
+    Logger().configure()
+    main_sync(Logger())
\ No newline at end of file
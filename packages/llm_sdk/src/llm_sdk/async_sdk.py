@@ -3,34 +3,63 @@
 # ---------------------------------------------------------------------
 from __future__ import annotations
 
-from dataclasses import dataclass, field, asdict
-from typing import AsyncIterator, Any
+import asyncio
+import inspect
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Any, Sequence
 
 # ---------------------------------------------------------------------
 # Third-party libraries
 # ---------------------------------------------------------------------
-from logger.logger import Logger
+import httpx
+from logger.logger import ContextLogger, Logger
 
 # ---------------------------------------------------------------------
 # Internal application imports
 # ---------------------------------------------------------------------
 from llm_sdk.lifecycle import AsyncResourceManager
 
-from llm_sdk.domain.chat import OutputMimeType, ChatRequest, ChatResponse, ChatStreamEvent
+from llm_sdk.domain.chat import OutputMimeType, ChatRequest, ChatResponse, ChatStreamEvent, MessageInput
 from llm_sdk.domain.embeddings import EmbeddingRequest, EmbeddingResponse
 
 from llm_sdk.providers.async_base import AsyncBaseLLMClient
-from llm_sdk.providers.async_registry import ProviderRegistry
+from llm_sdk.providers.async_registry import ProviderFactory, ProviderRegistry
 
 from llm_sdk.plugin_loader import load_provider_plugins
-from llm_sdk.context import Context
+from llm_sdk.context import cached_context
 from llm_sdk.exceptions import ValidationError
+from llm_sdk.http_client import build_async_http_client
 from llm_sdk.settings import SDKSettings, load_settings
 from llm_sdk.retries import RetryPolicy, with_async_retries
 from llm_sdk.utils.message_utils import _normalized_messages
+from llm_sdk.validators import validate_chat_request, validate_embedding_request
 
 
-@dataclass(frozen=True)
+def _accepts_http_client(factory: ProviderFactory) -> bool:
+    """
+    Check whether a factory's create() takes the shared http_client.
+
+    http_client is an optional extension of the factory contract: plugins
+    written against create(self, settings) keep working and simply build
+    their own HTTP client.
+
+    Args:
+        factory: Provider factory.
+
+    Returns:
+        bool
+    """
+    try:
+        params = inspect.signature(factory.create).parameters
+    except (TypeError, ValueError):
+        return False
+
+    return "http_client" in params or any(
+        p.kind is inspect.Parameter.VAR_KEYWORD for p in params.values()
+    )
+
+
+@dataclass(frozen=True, slots=True)
 class AsyncLLM:
     """
     Async SDK entry point.
@@ -40,6 +69,8 @@ class AsyncLLM:
     - retries + logging + validation in core
     - provider plugins via entrypoints
     - provider client caching (connection reuse)
+    - one pooled HTTP client shared by all providers
+    - "async with" support: resources are closed on exit
     """
 
     registry: ProviderRegistry
@@ -48,14 +79,20 @@ class AsyncLLM:
 
     retry_policy: RetryPolicy = field(default_factory=RetryPolicy)
 
+    http_client: httpx.AsyncClient | None = None
+
     logger: Logger | None = None
 
+    # Bound loggers per call site, so requests don't re-bind each time.
+    _loggers: dict[str, ContextLogger] = field(default_factory=dict, init=False, repr=False)
+
 
     @classmethod
     def default(
         cls,
         load_plugins: bool = False,
         logger: Logger | None = None,
+        warmup: bool = False,
     ) -> "AsyncLLM":
         """
         Build default AsyncLLM instance.
@@ -63,6 +100,8 @@ class AsyncLLM:
         Args:
             load_plugins: Whether to load provider plugins.
             logger: Optional logger instance. If None, no logs are emitted.
+            warmup: Create every async provider client now, as warmup()
+                does. Only useful together with load_plugins.
 
         Returns:
             AsyncLLM
@@ -71,14 +110,20 @@ class AsyncLLM:
         settings = load_settings()
 
         if load_plugins:
-            registry.load_plugins()
+            registry.load_plugins(eager=settings.eager_plugins)
 
-        return cls(
+        llm = cls(
             registry=registry,
             settings=settings,
+            http_client=build_async_http_client(settings.http, settings.timeouts),
             logger=logger
         )
 
+        if warmup:
+            llm._warmup()
+
+        return llm
+
 
     def load_plugins(self) -> None:
         """
@@ -89,21 +134,68 @@ class AsyncLLM:
         if self.logger is not None:
             log = self.logger.bind("load_plugins")
             log.info(
-                f"plugins.loaded | loaded: {result.loaded}, failed: {result.failed}"
+                "plugins.loaded | loaded: %s, failed: %s", result.loaded, result.failed
             )
 
 
     async def aclose(self) -> None:
         """
-        Close all cached provider resources.
+        Close all cached provider resources and the shared HTTP client.
         """
         await self.resources.aclose()
 
+        if self.http_client is not None:
+            await self.http_client.aclose()
+
+
+    async def __aenter__(self) -> "AsyncLLM":
+        return self
+
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+
+    async def warmup(self, providers: list[str] | None = None) -> None:
+        """
+        Eagerly create and cache provider clients.
+
+        Moves client construction (credentials, HTTP pool setup) off the
+        first request. Call it once at startup, after plugins are loaded.
+
+        Args:
+            providers: Provider names to warm up. Defaults to all registered
+                async providers.
+        """
+        self._warmup(providers)
+
+
+    def _warmup(self, providers: list[str] | None = None) -> None:
+        """
+        Create and cache provider clients (see warmup()).
+
+        Client construction doesn't await anything, so default() can run it
+        without an event loop.
+
+        Args:
+            providers: Provider names, or None for all async providers.
+        """
+        names = providers if providers is not None else self.registry.available()
+
+        for prov in names:
+            if not self.registry.spec(prov).is_async:
+                continue
+
+            self._get_provider_client(prov)
+
+        if self.logger is not None:
+            self.logger.bind("warmup").info("providers.warmed | %s", list(names))
+
 
     async def chat(
         self,
         *,
-        messages: list[tuple[str, str]],
+        messages: Sequence[MessageInput],
         provider: str | None = None,
         model: str | None = None,
         temperature: float = 0.2,
@@ -129,15 +221,11 @@ class AsyncLLM:
         prov = provider or self.settings.default_provider
         mod = model or self.settings.default_model
 
-        factory = self.registry.get(prov)
-        spec = factory.spec()
-
-        if not spec.supports_chat:
+        # Capability and input checks come first, so bad requests fail with
+        # ValidationError before any client (or credential) is built.
+        if not self.registry.spec(prov).supports_chat:
             raise ValidationError(f"provider '{prov}' does not support chat")
 
-        if not spec.is_async:
-            raise ValidationError(f"provider '{prov}' is not async (is_async=False)")
-
         req = ChatRequest(
             model=mod,
             messages=_normalized_messages(messages),
@@ -147,41 +235,105 @@ class AsyncLLM:
             output_mime_type=output_mime_type,
         )
 
-        self._validate_chat(req)
+        validate_chat_request(req)
 
-        client = await self._get_provider_client(prov)
-        ctx = Context(provider=prov, model=mod)
+        client = self._get_provider_client(prov)
 
-        if self.logger is not None:
-            self.logger.bind("async_chat").info(f"chat.request | {asdict(ctx)}")
+        log = self._bind("async_chat")
+        log_ctx = cached_context(prov, mod).log_line if log is not None else ""
 
-        async def _call() -> ChatResponse:
-            return await client.chat(req)
+        if log is not None:
+            log.info("chat.request | %s", log_ctx)
 
         resp = await with_async_retries(
-            fn=_call, provider=prov, retry_policy=self.retry_policy
+            client.chat, req, provider=prov, retry_policy=self.retry_policy
         )
 
-        if self.logger is not None:
-            self.logger.bind("async_chat").info(f"chat.response | {asdict(ctx)}")
+        if log is not None:
+            log.info("chat.response | %s", log_ctx)
 
         return resp
 
 
+    async def chat_many(
+        self,
+        *,
+        conversations: Sequence[Sequence[MessageInput]],
+        provider: str | None = None,
+        model: str | None = None,
+        temperature: float = 0.2,
+        max_output_tokens: int | None = None,
+        output_schema: dict[str, Any] | None = None,
+        output_mime_type: OutputMimeType = "application/json",
+        max_concurrency: int = 32,
+        return_exceptions: bool = False,
+    ) -> list[ChatResponse | BaseException]:
+        """
+        Run independent chat requests concurrently.
+
+        Each conversation goes through chat() (validation, retries,
+        logging); at most max_concurrency requests are in flight, and the
+        provider client is shared. Responses are returned in input order.
+
+        Args:
+            conversations: One message list per request.
+            provider: The provider name.
+            model: The model name.
+            temperature: The temperature to use for every chat.
+            max_output_tokens: The maximum number of output tokens.
+            output_schema: The output schema to use for every chat.
+            output_mime_type: The output MIME type to use for every chat.
+            max_concurrency: Max requests in flight at once.
+            return_exceptions: Return failures in place of their response
+                instead of raising the first one.
+
+        Returns:
+            list[ChatResponse | BaseException]: One entry per conversation.
+        """
+        if max_concurrency < 1:
+            raise ValidationError("max_concurrency must be >= 1")
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _call(messages: Sequence[MessageInput]) -> ChatResponse:
+            async with semaphore:
+                return await self.chat(
+                    messages=messages,
+                    provider=provider,
+                    model=model,
+                    temperature=temperature,
+                    max_output_tokens=max_output_tokens,
+                    output_schema=output_schema,
+                    output_mime_type=output_mime_type,
+                )
+
+        return await asyncio.gather(
+            *(_call(m) for m in conversations), return_exceptions=return_exceptions
+        )
+
+
     async def embed(
         self,
         *,
         input: list[str],
         provider: str | None = None,
         model: str | None = None,
+        batch_size: int = 96,
+        max_concurrency: int = 16,
     ) -> EmbeddingResponse:
         """
         Async embedding API.
 
+        Inputs larger than batch_size are split into batches that are sent
+        concurrently (at most max_concurrency in flight); vectors are
+        returned in input order.
+
         Args:
             input: The input text to embed.
             provider: The provider name.
             model: The model name.
+            batch_size: Max texts per provider call.
+            max_concurrency: Max batches in flight at once.
 
         Returns:
             EmbeddingResponse: The embedding response.
@@ -189,33 +341,50 @@ class AsyncLLM:
         prov = provider or self.settings.default_provider
         mod = model or self.settings.default_model
 
-        factory = self.registry.get(prov)
-        spec = factory.spec()
-
-        if not spec.supports_embeddings:
+        if not self.registry.spec(prov).supports_embeddings:
             raise ValidationError(f"provider '{prov}' does not support embeddings")
 
-        if not spec.is_async:
-            raise ValidationError(f"provider '{prov}' is not async (is_async=False)")
+        if batch_size < 1:
+            raise ValidationError("batch_size must be >= 1")
 
-        req = EmbeddingRequest(model=mod, input=input)
-        self._validate_embed(req)
-
-        client = await self._get_provider_client(prov)
-        ctx = Context(provider=prov, model=mod)
-
-        if self.logger is not None:
-            self.logger.bind("async_embed").info(f"embed.request | {asdict(ctx)}")
-
-        async def _call() -> EmbeddingResponse:
-            return await client.embed(req)
+        if max_concurrency < 1:
+            raise ValidationError("max_concurrency must be >= 1")
 
-        resp = await with_async_retries(
-            fn=_call, provider=prov, retry_policy=self.retry_policy
-        )
+        req = EmbeddingRequest(model=mod, input=input)
+        validate_embedding_request(req)
+
+        client = self._get_provider_client(prov)
+
+        log = self._bind("async_embed")
+        log_ctx = cached_context(prov, mod).log_line if log is not None else ""
+
+        if log is not None:
+            log.info("embed.request | %s", log_ctx)
+
+        batches = [
+            EmbeddingRequest(model=mod, input=input[i:i + batch_size])
+            for i in range(0, len(input), batch_size)
+        ]
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _call(batch: EmbeddingRequest) -> EmbeddingResponse:
+            async with semaphore:
+                return await with_async_retries(
+                    client.embed, batch, provider=prov, retry_policy=self.retry_policy
+                )
+
+        if len(batches) == 1:
+            resp = await _call(req)
+        else:
+            responses = await asyncio.gather(*(_call(b) for b in batches))
+            resp = EmbeddingResponse(
+                model=responses[0].model,
+                vectors=[v for r in responses for v in r.vectors],
+                raw={"batches": [r.raw for r in responses]},
+            )
 
-        if self.logger is not None:
-            self.logger.bind("async_embed").info(f"embed.response | {asdict(ctx)}")
+        if log is not None:
+            log.info("embed.response | %s", log_ctx)
 
         return resp
 
@@ -223,7 +392,7 @@ class AsyncLLM:
     async def stream_chat(
         self,
         *,
-        messages: list[tuple[str, str]],
+        messages: Sequence[MessageInput],
         provider: str | None = None,
         model: str | None = None,
         temperature: float = 0.2,
@@ -247,15 +416,9 @@ class AsyncLLM:
         prov = provider or self.settings.default_provider
         mod = model or self.settings.default_model
 
-        factory = self.registry.get(prov)
-        spec = factory.spec()
-
-        if not spec.supports_streaming:
+        if not self.registry.spec(prov).supports_streaming:
             raise ValidationError(f"provider '{prov}' does not support streaming")
 
-        if not spec.is_async:
-            raise ValidationError(f"provider '{prov}' is not async (is_async=False)")
-
         req = ChatRequest(
             model=mod,
             messages=_normalized_messages(messages),
@@ -264,27 +427,37 @@ class AsyncLLM:
             output_mime_type=output_mime_type,
         )
 
-        client = await self._get_provider_client(prov)
-        ctx = Context(provider=prov, model=mod)
+        validate_chat_request(req)
 
-        if self.logger is not None:
-            self.logger.bind("async_stream_chat").info(
-                f"stream.request | {asdict(ctx)}"
-            )
+        client = self._get_provider_client(prov)
+
+        # Providers end their stream with the done=True event, so events are
+        # forwarded without a per-event check and stream.done is logged once
+        # the provider stream is exhausted.
+        if self.logger is None:
+            async for event in client.stream_chat(req):
+                yield event
+            return
+
+        log = self._bind("async_stream_chat")
+        log_ctx = cached_context(prov, mod).log_line
+        log.info("stream.request | %s", log_ctx)
 
         async for event in client.stream_chat(req):
             yield event
-            if event.done:
-                if self.logger is not None:
-                    self.logger.bind("async_stream_chat").info(
-                        f"stream.done | {asdict(ctx)}"
-                    )
-                return
+
+        log.info("stream.done | %s", log_ctx)
 
 
-    async def _get_provider_client(self, provider: str) -> AsyncBaseLLMClient:
+    def _get_provider_client(
+        self,
+        provider: str,
+    ) -> AsyncBaseLLMClient:
         """
-        Get cached provider client or create a new one.
+        Get cached provider client or create it.
+
+        Callers check capabilities via registry.spec() (cached per provider)
+        before asking for the client.
 
         Args:
             provider: The provider name.
@@ -296,8 +469,17 @@ class AsyncLLM:
         if cached is not None:
             return cached
 
+        spec = self.registry.spec(provider)
+
+        if not spec.is_async:
+            raise ValidationError(f"provider '{provider}' is not async (is_async=False)")
+
         factory = self.registry.get(provider)
-        client = factory.create(self.settings)
+
+        if self.http_client is not None and _accepts_http_client(factory):
+            client = factory.create(self.settings, http_client=self.http_client)
+        else:
+            client = factory.create(self.settings)
 
         if not isinstance(client, AsyncBaseLLMClient):
             raise TypeError(
@@ -308,53 +490,20 @@ class AsyncLLM:
         return client
 
 
-    def _validate_chat(self, request: ChatRequest) -> None:
-        """
-        Validate chat request.
-
-        Args:
-            request: ChatRequest
-
-        Returns:
-            None
-        """
-        if not request.messages:
-            raise ValidationError("messages cannot be empty")
-
-        for m in request.messages:
-            parts = m.normalized_parts()
-            if not parts:
-                raise ValidationError("message parts cannot be empty")
-
-            has_any = False
-
-            for part in parts:
-                if part.type == "text" and part.text and part.text.strip():
-                    has_any = True
-                elif part.type in ("image_url", "file_uri") and (part.url or part.uri):
-                    has_any = True
-                elif part.type == "image_bytes" and part.data:
-                    has_any = True
-
-            if not has_any:
-                raise ValidationError("message parts must contain at least one valid part")
-
-        if request.temperature < 0.0 or request.temperature > 2.0:
-            raise ValidationError("temperature must be between 0 and 2")
-
-
-    def _validate_embed(self, request: EmbeddingRequest) -> None:
+    def _bind(self, context: str) -> ContextLogger | None:
         """
-        Validate embedding request.
+        Get the bound logger for a call site, created once per context.
 
         Args:
-            request: EmbeddingRequest
+            context: Log context name.
 
         Returns:
-            None
+            ContextLogger | None: None when no logger is configured.
         """
-        if not request.input:
-            raise ValidationError("input cannot be empty")
+        if self.logger is None:
+            return None
 
-        if any(not x.strip() for x in request.input):
-            raise ValidationError("input texts cannot be empty")
+        log = self._loggers.get(context)
+        if log is None:
+            log = self._loggers[context] = self.logger.bind(context)
+        return log
@@ -3,7 +3,8 @@
 # ---------------------------------------------------------------------
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 
 
 @dataclass(frozen=True, slots=True)
@@ -20,3 +21,32 @@ class Context:
     provider: str
     model: str
     request_id: str | None = None
+
+    # Formatted once so log calls do not rebuild it.
+    log_line: str = field(init=False, repr=False, compare=False)
+
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "log_line",
+            f"provider={self.provider} model={self.model} request_id={self.request_id}",
+        )
+
+
+@lru_cache(maxsize=64)
+def cached_context(provider: str, model: str) -> Context:
+    """
+    Shared Context per provider/model pair.
+
+    Context is frozen and carries its formatted log_line, so one instance
+    can serve every request for the same pair.
+
+    Args:
+        provider: Provider name.
+        model: Model name.
+
+    Returns:
+        Context
+    """
+    return Context(provider=provider, model=model)
@@ -110,8 +110,20 @@ class ChatPart:
 
 
 
+class _MessageMemo:
+    """
+    Private per-message memo slots.
+
+    Kept on a plain base class so they are not dataclass fields and stay
+    out of fields(), asdict() and repr of ChatMessage. Unset until first
+    written (via object.__setattr__); read them with getattr defaults.
+    """
+
+    __slots__ = ("_parts_cache", "_validated")
+
+
 @dataclass(frozen=True, slots=True)
-class ChatMessage:
+class ChatMessage(_MessageMemo):
     """
     A normalized chat message.
 
@@ -144,20 +156,33 @@ class ChatMessage:
         """
         Returns parts if provided, else converts content to a single text part.
 
+        The converted part is built once per message, so validation and the
+        provider client share it. Callers must not mutate the returned list.
+
         Returns:
             list[ChatPart]
         """
-        if self.parts and len(self.parts) > 0:
+        if self.parts:
             return self.parts
 
-        return [ChatPart.from_text(self.content)]
+        # Text part built from content on the first call (see _MessageMemo).
+        cached = getattr(self, "_parts_cache", None)
+        if cached is None:
+            cached = [ChatPart.from_text(self.content)]
+            object.__setattr__(self, "_parts_cache", cached)
 
+        return cached
 
-@dataclass(frozen=True, slots=True)
+
+@dataclass(slots=True)
 class ChatRequest:
     """
     Chat completion request.
 
+    Not frozen: one is built per call on the hot path, and a frozen
+    dataclass __init__ (object.__setattr__ per field) is ~2.5x slower.
+    Treat instances as read-only.
+
     Args:
         model: Model name.
         messages: Chat messages.
@@ -212,3 +237,5 @@ class ChatStreamEvent:
     usage: Usage | None = None
 
 ChatStream = Iterator[ChatStreamEvent]
+
+MessageInput = ChatMessage | tuple[str, str]
@@ -4,13 +4,19 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-@dataclass(frozen=True, slots=True)
+if TYPE_CHECKING:
+    import numpy as np
+
+@dataclass(slots=True)
 class EmbeddingRequest:
     """
     Embeddings request.
 
+    Not frozen for the same reason as ChatRequest: built per call (and per
+    batch), so the cheaper non-frozen __init__ matters. Treat as read-only.
+
     Args:
         model: Embedding model.
         input: Input texts.
@@ -36,3 +42,27 @@ class EmbeddingResponse:
     model: str
     vectors: list[list[float]]
     raw: dict[str, Any] | None = None
+
+
+    def as_array(self, dtype: str = "float32") -> np.ndarray:
+        """
+        Return vectors as a contiguous (n_inputs, dim) NumPy array.
+
+        float32 uses 4 bytes per value instead of a Python float object,
+        and lets similarity math run as a single matrix product.
+        Requires the optional numpy extra: pip install "llm-sdk-core[numpy]".
+
+        Args:
+            dtype: NumPy dtype for the array.
+
+        Returns:
+            np.ndarray
+        """
+        try:
+            import numpy as np
+        except ImportError as e:
+            raise ImportError(
+                'EmbeddingResponse.as_array() requires numpy: pip install "llm-sdk-core[numpy]"'
+            ) from e
+
+        return np.asarray(self.vectors, dtype=dtype)
@@ -0,0 +1,99 @@
+# ---------------------------------------------------------------------
+# Standard library
+# ---------------------------------------------------------------------
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+# ---------------------------------------------------------------------
+# Third-party libraries
+# ---------------------------------------------------------------------
+import httpx
+
+# ---------------------------------------------------------------------
+# Internal application imports
+# ---------------------------------------------------------------------
+from llm_sdk.timeouts import TimeoutConfig
+
+
+@dataclass(frozen=True, slots=True)
+class HttpConfig:
+    """
+    Connection pool configuration for the shared HTTP client.
+
+    Args:
+        max_connections: Max concurrent connections.
+        max_keepalive_connections: Max idle connections kept open.
+        keepalive_expiry: Idle connection lifetime (seconds).
+        http2: Multiplex requests over HTTP/2 connections. Requires the
+            http2 extra: pip install "llm-sdk-core[http2]".
+    """
+
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    http2: bool = False
+
+
+def pool_limits(http: HttpConfig) -> httpx.Limits:
+    """
+    Build httpx pool limits from an HttpConfig.
+
+    Args:
+        http: HttpConfig
+
+    Returns:
+        httpx.Limits
+    """
+    return httpx.Limits(
+        max_connections=http.max_connections,
+        max_keepalive_connections=http.max_keepalive_connections,
+        keepalive_expiry=http.keepalive_expiry,
+    )
+
+
+def require_http2(http: HttpConfig) -> None:
+    """
+    Check that HTTP/2 support is installed when http2 is enabled.
+
+    Args:
+        http: HttpConfig
+
+    Raises:
+        ImportError: If http2 is enabled but the h2 package is missing.
+    """
+    if http.http2:
+        try:
+            import h2  # noqa: F401
+        except ImportError as e:
+            raise ImportError(
+                'HttpConfig.http2 requires h2: pip install "llm-sdk-core[http2]"'
+            ) from e
+
+
+def build_async_http_client(http: HttpConfig, timeouts: TimeoutConfig) -> httpx.AsyncClient:
+    """
+    Build a pooled httpx.AsyncClient shared by all provider clients.
+
+    Args:
+        http: HttpConfig
+        timeouts: TimeoutConfig
+
+    Returns:
+        httpx.AsyncClient
+
+    Raises:
+        ImportError: If http2 is enabled but the h2 package is missing.
+    """
+    require_http2(http)
+
+    return httpx.AsyncClient(
+        http2=http.http2,
+        limits=pool_limits(http),
+        timeout=httpx.Timeout(
+            connect=timeouts.connect,
+            read=timeouts.read,
+            write=timeouts.write,
+            pool=timeouts.pool,
+        ),
+    )
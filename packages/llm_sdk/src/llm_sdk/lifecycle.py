@@ -13,7 +13,7 @@ from typing import AsyncIterator
 from llm_sdk.providers.async_base import AsyncBaseLLMClient
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AsyncResourceManager:
     """
     Tracks async provider clients and closes them on shutdown.
@@ -6,21 +6,16 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Callable
 
-# ---------------------------------------------------------------------
-# Third-party libraries
-# ---------------------------------------------------------------------
-from importlib.metadata import entry_points
-
 # ---------------------------------------------------------------------
 # Internal application imports
 # ---------------------------------------------------------------------
-from llm_sdk.providers.async_registry import ProviderRegistry
+from llm_sdk.providers.async_registry import ProviderRegistry, _discover_entry_points
 from llm_sdk.settings import SDKSettings
 
 
 RegisterFn: Callable[[ProviderRegistry, SDKSettings], None]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PluginLoadResult:
     """
     Plugin load result.
@@ -52,7 +47,8 @@ def load_provider_plugins(registry: ProviderRegistry, settings: SDKSettings) ->
         PluginLoadResult
     """
 
-    eps = entry_points().select(group="llm_sdk.providers")
+    # Shares the registry's per-process discovery cache.
+    eps = _discover_entry_points(ProviderRegistry.ENTRYPOINT_GROUP)
 
     loaded: list[str] = []
     failed: dict[str, str] = {}
@@ -67,7 +67,8 @@ class AsyncBaseLLMClient(ABC):
         """
         Stream chat tokens.
 
-        Providers may override.
+        Providers may override. The last event yielded must be the
+        done=True event.
 
         Args:
             request: ChatRequest
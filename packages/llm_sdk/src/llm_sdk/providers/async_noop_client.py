@@ -14,6 +14,15 @@ from llm_sdk.domain.models import Usage
 from llm_sdk.providers.async_base import AsyncBaseLLMClient
 
 
+# (ord(c) % 10) / 10.0, precomputed: indexing a tuple beats a float
+# conversion plus division per character.
+_DIGIT_VALUES: tuple[float, ...] = tuple(i / 10.0 for i in range(10))
+
+
+def _content(request: ChatRequest) -> str:
+    return f"[noop-async] model={request.model} messages={len(request.messages)}"
+
+
 class AsyncNoopLLMClient(AsyncBaseLLMClient):
     """
     Async no-op provider.
@@ -30,20 +39,19 @@ class AsyncNoopLLMClient(AsyncBaseLLMClient):
 
 
     async def chat(self, request: ChatRequest) -> ChatResponse:
-        content = f"[noop-async] model={request.model} messages={len(request.messages)}"
-        return ChatResponse(model=request.model, content=content, usage=Usage(0, 0, 0), raw=None)
+        return ChatResponse(
+            model=request.model, content=_content(request), usage=Usage(0, 0, 0), raw=None
+        )
 
 
     async def embed(self, request: EmbeddingRequest) -> EmbeddingResponse:
-        vectors: list[list[float]] = []
-        for text in request.input:
-            vec = [float((ord(c) % 10)) / 10.0 for c in text[:16]]
-            vectors.append(vec)
+        # deterministic pseudo-vector
+        vectors = [[_DIGIT_VALUES[ord(c) % 10] for c in text[:16]] for text in request.input]
         return EmbeddingResponse(model=request.model, vectors=vectors, raw=None)
 
 
     async def stream_chat(self, request: ChatRequest) -> AsyncIterator[ChatStreamEvent]:
-        msg = (await self.chat(request)).content
-        for ch in msg.split(" "):
+        # Split the text directly; no ChatResponse is needed here.
+        for ch in _content(request).split(" "):
             yield ChatStreamEvent(delta=ch + " ", done=False)
         yield ChatStreamEvent(delta="", done=True)
\ No newline at end of file
@@ -4,9 +4,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from importlib.metadata import entry_points
+from functools import lru_cache
+from importlib.metadata import EntryPoint, entry_points
 from typing import Protocol
 
+# ---------------------------------------------------------------------
+# Third-party libraries
+# ---------------------------------------------------------------------
+import httpx
+
 # ---------------------------------------------------------------------
 # Internal application imports
 # ---------------------------------------------------------------------
@@ -28,16 +34,47 @@ class ProviderFactory(Protocol):
     Provider plugin contract.
 
     Every provider plugin must expose a factory implementing this protocol.
+
+    The http_client parameter of create() is a backward-compatible
+    extension: AsyncLLM passes its shared pool only when it has one and the
+    factory's create() accepts http_client, so factories defined as
+    create(self, settings) are still called that way.
     """
 
     def spec(self) -> ProviderSpec: ...
 
-    def create(self, settings: SDKSettings) -> AsyncBaseLLMClient: ...
+    def create(
+        self,
+        settings: SDKSettings,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> AsyncBaseLLMClient: ...
+
+
+@lru_cache(maxsize=None)
+def _discover_entry_points(group: str) -> tuple[EntryPoint, ...]:
+    """
+    Scan installed distributions for entry points once per process.
+
+    Args:
+        group: Entry point group.
+
+    Returns:
+        tuple[EntryPoint, ...]
+    """
+    return tuple(entry_points().select(group=group))
 
 
 class ProviderRegistry:
     """
     Registry that loads provider plugins using Python entry points.
+
+    Plugins are discovered lazily by default: entry points are recorded by
+    name and only imported on the first get() for that provider.
+
+    Providers are registered under their spec name. An entry point whose
+    name differs from it stays reachable under the entry point name too,
+    and looking up a spec name that isn't loaded yet imports the remaining
+    deferred plugins to find it.
     """
 
     ENTRYPOINT_GROUP = "llm_sdk.providers"
@@ -45,20 +82,60 @@ class ProviderRegistry:
 
     def __init__(self) -> None:
         self._factories: dict[str, ProviderFactory] = {}
+        self._deferred: dict[str, EntryPoint] = {}
+        self._specs: dict[str, ProviderSpec] = {}
+        self._aliases: dict[str, str] = {}
+        self._sorted: list[str] | None = None
+
+
+    def load_plugins(self, eager: bool = False) -> None:
+        """
+        Discover all installed provider plugins via entry points.
+
+        Args:
+            eager: Import every plugin now instead of on first use.
+        """
+        for ep in _discover_entry_points(self.ENTRYPOINT_GROUP):
+            if ep.name in self._factories or ep.name in self._aliases:
+                continue
+
+            if eager:
+                self._load_entry_point(ep)
+            else:
+                self._deferred[ep.name] = ep
+                self._sorted = None
+
 
+    def _load_entry_point(self, ep: EntryPoint) -> None:
+        """
+        Import a plugin entry point and register its factory.
 
-    def load_plugins(self) -> None:
+        Args:
+            ep: Provider entry point.
         """
-        Load all installed provider plugins via entry points.
+        factory_cls = ep.load()
+        factory: ProviderFactory = factory_cls()
+        spec = factory.spec()
+        self._factories[spec.name] = factory
+        self._specs[spec.name] = spec
+        if ep.name != spec.name:
+            self._aliases[ep.name] = spec.name
+        self._sorted = None
+
+
+    def _load_deferred(self) -> None:
         """
-        eps = entry_points()
-        group = eps.select(group=self.ENTRYPOINT_GROUP)
+        Import every deferred plugin that still loads.
 
-        for ep in group:
-            factory_cls = ep.load()
-            factory: ProviderFactory = factory_cls()
-            spec = factory.spec()
-            self._factories[spec.name] = factory
+        Plugins that fail stay deferred, so their error is raised when they
+        are requested by name.
+        """
+        for name, ep in list(self._deferred.items()):
+            try:
+                self._load_entry_point(ep)
+            except Exception:
+                continue
+            del self._deferred[name]
 
 
     def get(self, name: str) -> ProviderFactory:
@@ -71,15 +148,60 @@ class ProviderRegistry:
         Returns:
             ProviderFactory.
         """
-        try:
-            return self._factories[name]
-        except KeyError as e:
-            available = ", ".join(sorted(self._factories.keys()))
-            raise KeyError(f"Unknown provider '{name}'. Available: {available}") from e
+        # Drop the deferred entry only once it loaded: a failed import is
+        # raised again on the next call instead of "Unknown provider".
+        ep = self._deferred.get(name)
+        if ep is not None:
+            self._load_entry_point(ep)
+            del self._deferred[name]
+
+        name = self._aliases.get(name, name)
+        factory = self._factories.get(name)
+
+        # Not an entry point name or a loaded spec name: it may be the spec
+        # name of a deferred plugin registered under another name.
+        if factory is None and self._deferred:
+            self._load_deferred()
+            factory = self._factories.get(name)
+
+        if factory is None:
+            available = ", ".join(self.available())
+            raise KeyError(f"Unknown provider '{name}'. Available: {available}")
+
+        return factory
+
+
+    def spec(self, name: str) -> ProviderSpec:
+        """
+        Get a provider's spec, cached per provider.
+
+        Specs are immutable, so factory.spec() is called at most once per
+        provider instead of on every lookup.
+
+        Args:
+            name: Provider name.
+
+        Returns:
+            ProviderSpec.
+        """
+        spec = self._specs.get(self._aliases.get(name, name))
+        if spec is None:
+            factory = self.get(name)
+            # Loading a deferred plugin records its spec (and any alias).
+            name = self._aliases.get(name, name)
+            spec = self._specs.get(name)
+            if spec is None:
+                spec = self._specs[name] = factory.spec()
+        return spec
 
 
     def available(self) -> list[str]:
         """
         Return installed provider names.
+
+        The sorted list is cached until plugins change; callers must not
+        mutate it.
         """
-        return sorted(self._factories.keys())
+        if self._sorted is None:
+            self._sorted = sorted(self._factories.keys() | self._deferred.keys())
+        return self._sorted
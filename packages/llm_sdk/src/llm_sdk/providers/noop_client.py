@@ -15,6 +15,15 @@ from llm_sdk.domain.models import Usage
 from llm_sdk.providers.sync_base import BaseLLMClient
 
 
+# Lookup for (ord(c) % 10) / 10.0.
+_DIGIT_VALUES: tuple[float, ...] = tuple(i / 10.0 for i in range(10))
+
+
+def _content(request: ChatRequest) -> str:
+    total_parts = sum(len(m.normalized_parts()) for m in request.messages)
+    return f"[noop] model={request.model} messages={len(request.messages)} parts={total_parts}"
+
+
 class NoopLLMClient(BaseLLMClient):
     """
     No-op provider for local development and tests.
@@ -31,22 +40,19 @@ class NoopLLMClient(BaseLLMClient):
 
 
     def chat(self, request: ChatRequest) -> ChatResponse:
-        total_parts = sum(len(m.normalized_parts()) for m in request.messages)
-        content = f"[noop] model={request.model} messages={len(request.messages)} parts={total_parts}"
-        return ChatResponse(model=request.model, content=content, usage=Usage(0, 0, 0), raw=None)
+        return ChatResponse(
+            model=request.model, content=_content(request), usage=Usage(0, 0, 0), raw=None
+        )
 
 
     def embed(self, request: EmbeddingRequest) -> EmbeddingResponse:
-        vectors: list[list[float]] = []
-        for text in request.input:
-            # deterministic pseudo-vector
-            vec = [float((ord(c) % 10)) / 10.0 for c in text[:16]]
-            vectors.append(vec)
+        # deterministic pseudo-vector
+        vectors = [[_DIGIT_VALUES[ord(c) % 10] for c in text[:16]] for text in request.input]
         return EmbeddingResponse(model=request.model, vectors=vectors, raw=None)
 
 
     def stream_chat(self, request: ChatRequest) -> Iterator[ChatStreamEvent]:
-        msg = self.chat(request).content
-        for ch in msg.split(" "):
+        # Split the text directly; no ChatResponse is needed here.
+        for ch in _content(request).split(" "):
             yield ChatStreamEvent(delta=ch + " ")
         yield ChatStreamEvent(delta="", done=True)
@@ -67,6 +67,7 @@ class BaseLLMClient(ABC):
         Stream chat tokens.
 
         Providers may override. Default raises NotImplementedError.
+        The last event yielded must be the done=True event.
 
         Args:
             request: ChatRequest
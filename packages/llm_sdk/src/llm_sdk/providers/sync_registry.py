@@ -43,6 +43,8 @@ class ProviderRegistry:
 
     def __init__(self) -> None:
         self._providers: dict[str, ProviderSpec] = {}
+        self._sorted: list[str] | None = None
+        self._resolved: set[tuple[str, str]] = set()
 
 
     def register(self, spec: ProviderSpec) -> None:
@@ -53,6 +55,8 @@ class ProviderRegistry:
             spec: ProviderSpec
         """
         self._providers[spec.name] = spec
+        self._sorted = None
+        self._resolved.clear()
 
 
     def get(self, name: str) -> ProviderSpec:
@@ -77,6 +81,9 @@ class ProviderRegistry:
         """
         Validate that model exists for provider.
 
+        Successful (provider, model) pairs are remembered until the next
+        register(), so repeated requests skip the lookup.
+
         Args:
             provider: Provider name.
             model: Model name.
@@ -87,11 +94,15 @@ class ProviderRegistry:
         Raises:
             ModelNotFoundError
         """
+        if (provider, model) in self._resolved:
+            return model
+
         spec = self.get(provider)
 
         if model not in spec.models:
             raise ModelNotFoundError(f"Model '{model}' not found for provider '{provider}'")
 
+        self._resolved.add((provider, model))
         return model
 
 
@@ -99,7 +110,12 @@ class ProviderRegistry:
         """
         List registered providers.
 
+        The sorted list is cached until the next register(); callers must
+        not mutate it.
+
         Returns:
             list[str]
         """
-        return sorted(self._providers.keys())
+        if self._sorted is None:
+            self._sorted = sorted(self._providers)
+        return self._sorted
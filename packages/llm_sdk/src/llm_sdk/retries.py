@@ -6,8 +6,8 @@ from __future__ import annotations
 import random
 import asyncio
 import time
-from dataclasses import dataclass
-from typing import Awaitable, Callable, TypeVar
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Literal, TypeVar
 
 # ---------------------------------------------------------------------
 # Internal application imports
@@ -26,34 +26,68 @@ class RetryPolicy:
         max_attempts: Total attempts (1 means no retries).
         base_delay_s: Initial delay.
         max_delay_s: Max delay cap.
+        jitter: "equal" keeps each delay within [backoff/2, backoff);
+            "decorrelated" draws it from [base, 3 * previous delay], which
+            spreads out callers that failed at the same moment.
     """
 
     max_attempts: int = 3
     base_delay_s: float = 0.25
     max_delay_s: float = 3.0
+    jitter: Literal["equal", "decorrelated"] = "equal"
 
+    # Capped exponential backoff per attempt, computed once.
+    _backoff: tuple[float, ...] = field(init=False, repr=False, compare=False)
 
-    def compute_delay(self, attempt: int) -> float:
+    # Jitter source owned by this policy, so concurrent retries don't all
+    # draw from the random module's shared generator.
+    _rng: random.Random = field(init=False, repr=False, compare=False)
+
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "_backoff",
+            tuple(
+                min(self.max_delay_s, self.base_delay_s * (2 ** attempt))
+                for attempt in range(max(self.max_attempts, 1))
+            ),
+        )
+        object.__setattr__(self, "_rng", random.Random())
+
+
+    def compute_delay(self, attempt: int, prev_delay: float | None = None) -> float:
         """
         Compute the delay for a specific retry attempt.
 
+        The backoff doubles per attempt (capped at max_delay_s) and is
+        jittered down to half its value, so concurrent callers spread out
+        without ever retrying sooner than half the backoff. With
+        jitter="decorrelated" the delay depends on the previous one instead.
+
         Args:
             attempt: The current retry attempt (0-indexed).
+            prev_delay: Delay used before this attempt (decorrelated only).
 
         Returns:
             The computed delay in seconds.
         """
-        exp = min(self.max_delay_s, self.base_delay_s * (2 ** attempt - 1))
-        jitter = random.uniform(0, self.base_delay_s)
-        return exp + jitter
+        if self.jitter == "decorrelated":
+            upper = (prev_delay or self.base_delay_s) * 3
+            return min(self.max_delay_s, self._rng.uniform(self.base_delay_s, upper))
+
+        backoff = self._backoff
+        exp = backoff[attempt] if attempt < len(backoff) else self.max_delay_s
+        return exp * (0.5 + 0.5 * self._rng.random())
 
 
 def with_retries(
-    *,
-    fn: callable[[], T],
+    fn: Callable[..., T],
+    *args: Any,
     provider: str,
-    retry_policy: RetryPolicy
-):
+    retry_policy: RetryPolicy,
+    **kwargs: Any,
+) -> T:
     """
     Execute a function with retry policy.
 
@@ -61,7 +95,8 @@ def with_retries(
     Converts repeated retryable errors into TimeoutError.
 
     Args:
-        fn: Callable without args.
+        fn: Callable, invoked as fn(*args, **kwargs) on each attempt.
+            Still accepted as fn= for zero-argument callables.
         provider: Provider name.
         policy: RetryPolicy.
 
@@ -74,24 +109,31 @@ def with_retries(
     """
 
     last_error: ProviderError | None = None
+    delay: float | None = None
+    last_attempt = retry_policy.max_attempts - 1
 
     for attempt in range(retry_policy.max_attempts):
         try:
-            return fn()
+            return fn(*args, **kwargs)
         except ProviderError as e:
             if not e.is_retryable:
                 raise
             last_error = e
-            time.sleep(retry_policy.compute_delay(attempt))
+            # No backoff after the final attempt: nothing follows it.
+            if attempt == last_attempt:
+                break
+            delay = retry_policy.compute_delay(attempt, delay)
+            time.sleep(delay)
 
     raise TimeoutError(provider=provider, last_error=last_error)
 
 
 async def with_async_retries(
-    *,
-    fn: Callable[[], Awaitable[T]],
+    fn: Callable[..., Awaitable[T]],
+    *args: Any,
     provider: str,
-    retry_policy: RetryPolicy
+    retry_policy: RetryPolicy,
+    **kwargs: Any,
 ) -> T:
     """
     Execute an async function with retry policy.
@@ -99,7 +141,9 @@ async def with_async_retries(
     Retries only ProviderError(is_retryable=True).
 
     Args:
-        fn: Async callable without args.
+        fn: Async callable, invoked as fn(*args, **kwargs) on each attempt.
+            Passing a bound method plus its args avoids building a closure
+            per request.
         provider: Provider name.
         policy: RetryPolicy.
 
@@ -112,14 +156,20 @@ async def with_async_retries(
     """
 
     last_error: ProviderError | None = None
+    delay: float | None = None
+    last_attempt = retry_policy.max_attempts - 1
 
-    for attempt in range(1, retry_policy.max_attempts + 1):
+    for attempt in range(retry_policy.max_attempts):
         try:
-            return await fn()
+            return await fn(*args, **kwargs)
         except ProviderError as e:
-            last_error = e
-            if not e.is_retryable or attempt >= retry_policy.max_attempts:
+            if not e.is_retryable:
                 raise
-            await asyncio.sleep(retry_policy.compute_delay(attempt))
+            last_error = e
+            # No backoff after the final attempt: nothing follows it.
+            if attempt == last_attempt:
+                break
+            delay = retry_policy.compute_delay(attempt, delay)
+            await asyncio.sleep(delay)
 
-    raise TimeoutError(f"[{provider}] retries exhausted: {last_error}")
+    raise TimeoutError(provider=provider, last_error=last_error)
@@ -14,6 +14,7 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 # ---------------------------------------------------------------------
 # Internal application imports
 # ---------------------------------------------------------------------
+from llm_sdk.http_client import HttpConfig
 from llm_sdk.retries import RetryPolicy
 from llm_sdk.timeouts import TimeoutConfig
 
@@ -34,6 +35,34 @@ class GeminiSettings(BaseSettings):
 
     location: str = Field(default="us-central1")
 
+    # Max embedding vectors kept in memory per client; 0 disables the cache.
+    embedding_cache_size: int = Field(default=10_000, ge=0)
+
+    # Max texts per embed_content call; larger inputs are split.
+    embedding_batch_size: int = Field(default=100, ge=1)
+
+    # Exact-match chat cache: max responses per client; 0 disables it.
+    response_cache_size: int = Field(default=0, ge=0)
+
+    # Semantic chat cache (needs numpy); disabled unless a threshold is set.
+    semantic_cache_threshold: float | None = Field(default=None, gt=0.0, le=1.0)
+    semantic_cache_size: int = Field(default=1000, ge=1)
+    semantic_cache_ttl_s: float = Field(default=3600.0, gt=0.0)
+    semantic_cache_model: str = Field(default="text-multilingual-embedding-002")
+    semantic_cache_int8: bool = Field(default=False)
+
+    # Async streaming: chunks merged per event (1 disables) and flush window.
+    stream_max_batch: int = Field(default=50, ge=1)
+    stream_flush_ms: float = Field(default=50.0, ge=0.0)
+
+    # Sync streaming: chunks merged per event. Off (1) by default: a blocking
+    # stream can only flush when the next chunk arrives, so merging holds
+    # text back for up to one inter-chunk gap.
+    sync_stream_max_batch: int = Field(default=1, ge=1)
+
+    # Max concurrent Gemini calls per async client; 0 disables the cap.
+    max_concurrent_requests: int = Field(default=30, ge=0)
+
 
 class SDKSettings(BaseSettings):
     """
@@ -53,22 +82,55 @@ class SDKSettings(BaseSettings):
         extra="ignore",
     )
 
-    gemini: GeminiSettings = GeminiSettings()
+    # default_factory: built when SDKSettings is, not when this module is
+    # imported, so LLM_SDK_GEMINI_* env vars are read at load_settings() time.
+    gemini: GeminiSettings = Field(default_factory=GeminiSettings)
 
     env: Literal["dev", "prod"] = "dev"
 
-    default_provider: str = "noop"
-    default_model: str = "noop-model"
+    default_provider: str = Field(default="noop", min_length=1)
+    default_model: str = Field(default="noop-model", min_length=1)
+
+    eager_plugins: bool = False
+
+    retries: RetryPolicy = Field(default_factory=RetryPolicy)
+    timeouts: TimeoutConfig = Field(default_factory=TimeoutConfig)
+    http: HttpConfig = Field(default_factory=HttpConfig)
+
 
-    retries: RetryPolicy = RetryPolicy()
-    timeouts: TimeoutConfig = TimeoutConfig()
+_settings_cache: SDKSettings | None = None
 
 
 def load_settings(**kwargs) -> SDKSettings:
     """
     Load SDK settings.
 
+    Without overrides, the environment/.env is parsed once and the same
+    SDKSettings instance is returned afterwards; treat it as read-only.
+    Call reset_settings() after changing the environment.
+
+    Args:
+        **kwargs: Field overrides; bypass the cache.
+
     Returns:
         SDKSettings
     """
-    return SDKSettings(**kwargs)
+    global _settings_cache
+
+    if kwargs:
+        return SDKSettings(**kwargs)
+
+    if _settings_cache is None:
+        _settings_cache = SDKSettings()
+
+    return _settings_cache
+
+
+def reset_settings() -> None:
+    """
+    Drop the cached settings so the next load_settings() re-reads the
+    environment (e.g. between tests).
+    """
+    global _settings_cache
+    _settings_cache = None
+
@@ -3,20 +3,21 @@
 # ---------------------------------------------------------------------
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Sequence
 
 # ---------------------------------------------------------------------
 # Third-party libraries
 # ---------------------------------------------------------------------
-from logger.logger import Logger
+from logger.logger import ContextLogger, Logger
 
 # ---------------------------------------------------------------------
 # Internal application imports
 # ---------------------------------------------------------------------
-from llm_sdk.context import Context
+from llm_sdk.context import cached_context
 
-from llm_sdk.domain.chat import OutputMimeType, ChatRequest, ChatResponse, ChatStream
+from llm_sdk.domain.chat import OutputMimeType, ChatRequest, ChatResponse, ChatStream, MessageInput
 from llm_sdk.domain.embeddings import EmbeddingRequest, EmbeddingResponse
 
 from llm_sdk.providers.sync_base import BaseLLMClient as LLMClient
@@ -27,6 +28,7 @@ from llm_sdk.retries import with_retries
 from llm_sdk.settings import SDKSettings, load_settings
 
 from llm_sdk.utils.message_utils import _normalized_messages
+from llm_sdk.validators import validate_chat_request, validate_embedding_request
 
 
 @dataclass(slots=True)
@@ -47,6 +49,19 @@ class LLM:
 
     # Internal cache: reuse provider clients (important for HTTP sessions).
     _clients: dict[str, LLMClient] = field(default_factory=dict, init=False, repr=False)
+    _last_client: tuple[str, LLMClient] | None = field(default=None, init=False, repr=False)
+
+    # Bound loggers per call site, so requests don't re-bind each time.
+    _loggers: dict[str, ContextLogger] = field(default_factory=dict, init=False, repr=False)
+
+
+    def __post_init__(self) -> None:
+        # Checked once here so _resolve_provider_and_model needs no
+        # per-request emptiness checks.
+        if not self.settings.default_provider:
+            raise ValidationError("default_provider cannot be empty")
+        if not self.settings.default_model:
+            raise ValidationError("default_model cannot be empty")
 
 
     @classmethod
@@ -103,7 +118,7 @@ class LLM:
     def chat(
         self,
         *,
-        messages: list[tuple[str, str]],
+        messages: Sequence[MessageInput],
         provider: str | None = None,
         model: str | None = None,
         temperature: float = 0.2,
@@ -115,7 +130,7 @@ class LLM:
         High-level chat API.
 
         Args:
-            messages: List of (role, content).
+            messages: ChatMessage objects or (role, content) tuples.
             provider: Provider override.
             model: Model override.
             temperature: Sampling temperature.
@@ -138,23 +153,95 @@ class LLM:
 
         validate_chat_request(req)
 
-        ctx = Context(provider=prov, model=mod)
+        # Bind the logger and format the context once for both log lines.
+        log = self._bind("sync_chat")
+        log_ctx = cached_context(prov, mod).log_line if log is not None else ""
 
-        if self.logger is not None:
-            self.logger.bind("sync_chat").info(f"chat.request | {asdict(ctx)}")
+        if log is not None:
+            log.info("chat.request | %s", log_ctx)
 
         client = self._get_client(prov)
 
-        def call() -> ChatResponse:
-            return client.chat(req)
-
-        resp = with_retries(fn=call, provider=prov, retry_policy=self.settings.retries)
+        resp = with_retries(
+            client.chat, req, provider=prov, retry_policy=self.settings.retries
+        )
 
-        if self.logger is not None:
-            self.logger.bind("sync_chat").info(f"chat.response | {asdict(ctx)}")
+        if log is not None:
+            log.info("chat.response | %s", log_ctx)
 
         return resp
 
+
+    def chat_many(
+        self,
+        *,
+        conversations: Sequence[Sequence[MessageInput]],
+        provider: str | None = None,
+        model: str | None = None,
+        temperature: float = 0.2,
+        max_output_tokens: int | None = None,
+        output_schema: dict[str, Any] | None = None,
+        output_mime_type: OutputMimeType = "application/json",
+        max_concurrency: int = 16,
+        return_exceptions: bool = False,
+    ) -> list[ChatResponse | BaseException]:
+        """
+        Run independent chat requests from a thread pool.
+
+        Each conversation goes through chat() (validation, retries,
+        logging); at most max_concurrency requests are in flight, and the
+        provider client is shared. Responses are returned in input order.
+
+        Args:
+            conversations: One message list per request.
+            provider: Provider override.
+            model: Model override.
+            temperature: Sampling temperature for every chat.
+            max_output_tokens: Output token limit.
+            output_schema: Output schema for every chat.
+            output_mime_type: Output MIME type for every chat.
+            max_concurrency: Max requests in flight at once.
+            return_exceptions: Return failures in place of their response
+                instead of raising the first one.
+
+        Returns:
+            list[ChatResponse | BaseException]: One entry per conversation.
+        """
+        if max_concurrency < 1:
+            raise ValidationError("max_concurrency must be >= 1")
+
+        if not conversations:
+            return []
+
+        # Resolve the client once up front so worker threads don't race to
+        # create it; the provider/model check runs first so an unknown model
+        # fails before any client is built.
+        prov, mod = self._resolve_provider_and_model(provider, model)
+        self.registry.resolve_model(prov, mod)
+        self._get_client(prov)
+
+        def call(messages: Sequence[MessageInput]) -> ChatResponse | BaseException:
+            try:
+                return self.chat(
+                    messages=messages,
+                    provider=provider,
+                    model=model,
+                    temperature=temperature,
+                    max_output_tokens=max_output_tokens,
+                    output_schema=output_schema,
+                    output_mime_type=output_mime_type,
+                )
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                return e
+
+        # map() yields results in submission order and re-raises the first
+        # failure when return_exceptions is False.
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(conversations))) as pool:
+            return list(pool.map(call, conversations))
+
+
     def embed(
         self,
         *,
@@ -179,19 +266,93 @@ class LLM:
         req = EmbeddingRequest(model=mod, input=input)
         validate_embedding_request(req)
 
-        ctx = Context(provider=prov, model=mod)
-        if self.logger is not None:
-            self.logger.bind("sync_embed").info(f"embed.request | {asdict(ctx)}")
+        log = self._bind("sync_embed")
+        log_ctx = cached_context(prov, mod).log_line if log is not None else ""
+
+        if log is not None:
+            log.info("embed.request | %s", log_ctx)
 
         client = self._get_client(prov)
 
-        def call() -> EmbeddingResponse:
-            return client.embed(req)
+        resp = with_retries(
+            client.embed, req, provider=prov, retry_policy=self.settings.retries
+        )
+
+        if log is not None:
+            log.info("embed.response | %s", log_ctx)
+
+        return resp
+
+
+    def embed_many(
+        self,
+        *,
+        input: list[str],
+        provider: str | None = None,
+        model: str | None = None,
+        batch_size: int = 64,
+        max_concurrency: int = 8,
+    ) -> EmbeddingResponse:
+        """
+        Embeddings API for large inputs.
+
+        Splits input into batches of batch_size and sends them from a thread
+        pool (at most max_concurrency requests in flight). Vectors are
+        returned in input order.
+
+        Args:
+            input: List of texts.
+            provider: Provider override.
+            model: Model override.
+            batch_size: Max texts per provider call.
+            max_concurrency: Max batches in flight at once.
+
+        Returns:
+            EmbeddingResponse
+        """
+        if batch_size < 1:
+            raise ValidationError("batch_size must be >= 1")
+
+        if max_concurrency < 1:
+            raise ValidationError("max_concurrency must be >= 1")
+
+        if len(input) <= batch_size:
+            return self.embed(input=input, provider=provider, model=model)
+
+        prov, mod = self._resolve_provider_and_model(provider, model)
+        self.registry.resolve_model(prov, mod)
+
+        validate_embedding_request(EmbeddingRequest(model=mod, input=input))
+
+        log = self._bind("sync_embed_many")
+        log_ctx = cached_context(prov, mod).log_line if log is not None else ""
+
+        if log is not None:
+            log.info("embed.request | %s", log_ctx)
 
-        resp = with_retries(fn=call, provider=prov, retry_policy=self.settings.retries)
+        client = self._get_client(prov)
+        batches = [
+            EmbeddingRequest(model=mod, input=input[i:i + batch_size])
+            for i in range(0, len(input), batch_size)
+        ]
+
+        def call(batch: EmbeddingRequest) -> EmbeddingResponse:
+            return with_retries(
+                client.embed, batch, provider=prov, retry_policy=self.settings.retries
+            )
+
+        # map() yields results in submission order, so vectors stay aligned.
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(batches))) as pool:
+            responses = list(pool.map(call, batches))
+
+        resp = EmbeddingResponse(
+            model=responses[0].model,
+            vectors=[v for r in responses for v in r.vectors],
+            raw={"batches": [r.raw for r in responses]},
+        )
 
-        if self.logger is not None:
-            self.logger.bind("sync_embed").info(f"embed.response | {asdict(ctx)}")
+        if log is not None:
+            log.info("embed.response | %s", log_ctx)
 
         return resp
 
@@ -199,7 +360,7 @@ class LLM:
     def stream_chat(
         self,
         *,
-        messages: list[tuple[str, str]],
+        messages: Sequence[MessageInput],
         provider: str | None = None,
         model: str | None = None,
         temperature: float = 0.2,
@@ -215,7 +376,7 @@ class LLM:
             If you want, you can add a "handshake retry" wrapper.
 
         Args:
-            messages: List of (role, content).
+            messages: ChatMessage objects or (role, content) tuples.
             provider: Provider override.
             model: Model override.
             temperature: Sampling temperature.
@@ -238,18 +399,22 @@ class LLM:
         validate_chat_request(req)
 
         client = self._get_client(prov)
-        ctx = Context(provider=prov, model=mod)
 
-        if self.logger is not None:
-            self.logger.bind("sync_stream_chat").info(f"stream.request | {asdict(ctx)}")
+        # No per-chunk retries (safe). Providers end their stream with the
+        # done=True event, so events are delegated with yield from instead
+        # of being inspected one by one.
+        if self.logger is None:
+            yield from client.stream_chat(req)
+            return
+
+        log = self._bind("sync_stream_chat")
+        log_ctx = cached_context(prov, mod).log_line
+        log.info("stream.request | %s", log_ctx)
 
-        # No per-chunk retries (safe).
-        for event in client.stream_chat(req):
-            yield event
-            if event.done:
-                if self.logger is not None:
-                    self.logger.bind("sync_stream_chat").info(f"stream.done | {asdict(ctx)}")
-                return
+        yield from client.stream_chat(req)
+
+        # Only reached when the provider stream is exhausted normally.
+        log.info("stream.done | %s", log_ctx)
 
     # -----------------------------------------------------------------
     # Internal helpers
@@ -267,18 +432,16 @@ class LLM:
             provider: Optional provider override
             model: Optional model override
 
+        Empty overrides fall back to the defaults, which __post_init__ has
+        already checked, so the result is never empty.
+
         Returns:
             (provider, model)
         """
-        prov = provider or self.settings.default_provider
-        mod = model or self.settings.default_model
-
-        if not prov:
-            raise ValidationError("provider cannot be empty")
-        if not mod:
-            raise ValidationError("model cannot be empty")
-
-        return prov, mod
+        return (
+            provider or self.settings.default_provider,
+            model or self.settings.default_model,
+        )
 
 
     def _get_client(self, provider: str) -> LLMClient:
@@ -291,70 +454,35 @@ class LLM:
         Returns:
             LLMClient
         """
-        cached = self._clients.get(provider)
-        if cached is not None:
-            return cached
-
-        spec = self.registry.get(provider)
-        client = spec.factory()
-
-        self._clients[provider] = client
+        # Most callers stick to one provider: check it before the dict.
+        last = self._last_client
+        if last is not None and last[0] == provider:
+            return last[1]
+
+        client = self._clients.get(provider)
+        if client is None:
+            spec = self.registry.get(provider)
+            client = spec.factory()
+            self._clients[provider] = client
+
+        self._last_client = (provider, client)
         return client
 
 
-# ---------------------------------------------------------------------
-# Validators (should live in llm_sdk/validators/*.py)
-# ---------------------------------------------------------------------
-
-def validate_chat_request(request: ChatRequest) -> None:
-    """
-    Validate chat request.
-
-    Args:
-        request: ChatRequest
-
-    Raises:
-        ValidationError
-    """
-    if not request.messages:
-        raise ValidationError("messages cannot be empty")
-
-    for m in request.messages:
-        parts = m.normalized_parts()
-
-        if not parts:
-            raise ValidationError("message parts cannot be empty")
-
-        has_any = False
-
-        for part in parts:
-
-            if part.type == "text" and part.text and part.text.strip():
-                has_any = True
-            elif part.type in ("image_url", "file_uri") and (part.url or part.uri):
-                has_any = True
-            elif part.type == "image_bytes" and part.data:
-                has_any = True
-
-        if not has_any:
-            raise ValidationError("message parts must contain at least one valid part")
-
-    if request.temperature < 0.0 or request.temperature > 2.0:
-        raise ValidationError("temperature must be between 0 and 2")
-
-
-def validate_embedding_request(request: EmbeddingRequest) -> None:
-    """
-    Validate embedding request.
+    def _bind(self, context: str) -> ContextLogger | None:
+        """
+        Get the bound logger for a call site, created once per context.
 
-    Args:
-        request: EmbeddingRequest
+        Args:
+            context: Log context name.
 
-    Raises:
-        ValidationError
-    """
-    if not request.input:
-        raise ValidationError("input cannot be empty")
+        Returns:
+            ContextLogger | None: None when no logger is configured.
+        """
+        if self.logger is None:
+            return None
 
-    if any(not x.strip() for x in request.input):
-        raise ValidationError("input texts cannot be empty")
+        log = self._loggers.get(context)
+        if log is None:
+            log = self._loggers[context] = self.logger.bind(context)
+        return log
@@ -10,11 +10,15 @@ from typing import Generic, TypeVar
 T = TypeVar("T")
 
 
-dataclass(frozen=True, slots=True)
+@dataclass(frozen=True, slots=True)
 class Result(Generic[T]):
     """
     Small Result type to avoid leaking provider exceptions.
 
+    Construct as Result(...), not Result[T](...): on Python 3.11 a
+    subscripted call tries to set __orig_class__ on the frozen, slotted
+    instance and fails.
+
     Attributes:
         ok: True if success.
         value: Result value (when ok=True).
@@ -1,48 +1,72 @@
 # ---------------------------------------------------------------------
 # Standard library
 # ---------------------------------------------------------------------
-from typing import Any
+from operator import attrgetter
+from typing import Any, Sequence
 
 # ---------------------------------------------------------------------
 # Internal application imports
 # ---------------------------------------------------------------------
 
-from llm_sdk.domain.chat import ChatMessage, Usage
+from llm_sdk.domain.chat import ChatMessage, MessageInput, Usage
+from llm_sdk.exceptions import ValidationError
 
 
-def _msg(role: str, content: str) -> ChatMessage:
+def _to_message(message: MessageInput) -> ChatMessage:
     """
-    Create a chat message.
+    Convert a single message input into a ChatMessage.
 
     Args:
-        role: The role of the message sender (user/system).
-        content: The content of the message.
+        message: ChatMessage or (role, content) pair.
 
     Returns:
         ChatMessage
+
+    Raises:
+        ValidationError: If the input is not a ChatMessage or a 2-item
+            tuple/list of strings (e.g. a set, whose unpack order is
+            arbitrary).
     """
-    return ChatMessage(role=role, content=content)
+    if isinstance(message, ChatMessage):
+        return message
+
+    if isinstance(message, (tuple, list)) and len(message) == 2:
+        role, content = message
+        if not isinstance(role, str) or not isinstance(content, str):
+            raise ValidationError("(role, content) message items must both be strings")
+        return ChatMessage(role=role, content=content)
 
+    raise ValidationError(
+        f"messages must be ChatMessage or (role, content) tuples, got {type(message).__name__}"
+    )
 
-def _normalized_messages(messages: list[ChatMessage | tuple[str, str]]) -> list[ChatMessage]:
+
+def _normalized_messages(messages: Sequence[MessageInput]) -> list[ChatMessage]:
     """
     Normalize messages to a consistent format.
 
     Args:
-        messages: List of messages to normalize.
+        messages: Sequence of messages to normalize.
 
     Returns:
         List of normalized ChatMessage objects.
     """
-    normalized_messages: list[ChatMessage] = []
+    # Already-normalized input is passed through without copying.
+    if isinstance(messages, list) and all(isinstance(m, ChatMessage) for m in messages):
+        return messages
+
+    # Exact-type check inline skips a call frame for ChatMessage items;
+    # tuples (and ChatMessage subclasses) go through _to_message.
+    cm = ChatMessage
+    return [m if type(m) is cm else _to_message(m) for m in messages]
 
-    for message in messages:
-        if isinstance(message, ChatMessage):
-            normalized_messages.append(message)
-        else:
-            role, content = message
-            normalized_messages.append(_msg(role, content))
-    return normalized_messages
+
+_usage_counts = attrgetter(
+    "prompt_token_count",
+    "candidates_token_count",
+    "total_token_count",
+    "thoughts_token_count",
+)
 
 
 def extract_token_usage(resp: Any) -> Usage | None:
@@ -55,14 +79,30 @@ def extract_token_usage(resp: Any) -> Usage | None:
     if not usage:
         return None
 
-    prompt = getattr(usage, "prompt_token_count", None)
-    completion = getattr(usage, "candidates_token_count", None)
-    total = getattr(usage, "total_token_count", None)
-    thought = getattr(usage, "thoughts_token_count", None)
+    # google-genai's usage metadata always defines these fields, already
+    # validated as int | None, so they are read in one attrgetter call and
+    # used as-is. Other response shapes fall back to getattr with defaults
+    # and int() coercion.
+    try:
+        prompt, completion, total, thought = _usage_counts(usage)
+    except AttributeError:
+        prompt = _opt_int(getattr(usage, "prompt_token_count", None))
+        completion = _opt_int(getattr(usage, "candidates_token_count", None))
+        total = _opt_int(getattr(usage, "total_token_count", None))
+        thought = _opt_int(getattr(usage, "thoughts_token_count", None))
+
+    # Metadata with no counts at all (common on intermediate stream chunks)
+    # carries no usage; don't build an empty Usage for it.
+    if prompt is None and completion is None and total is None and thought is None:
+        return None
 
     return Usage(
-        prompt_tokens=int(prompt) if prompt is not None else None,
-        completion_tokens=int(completion) if completion is not None else None,
-        total_tokens=int(total) if total is not None else None,
-        thought_tokens=int(thought) if thought is not None else None,
-    )
\ No newline at end of file
+        prompt_tokens=prompt,
+        completion_tokens=completion,
+        total_tokens=total,
+        thought_tokens=thought,
+    )
+
+
+def _opt_int(value: Any) -> int | None:
+    return int(value) if value is not None else None
@@ -0,0 +1,83 @@
+# ---------------------------------------------------------------------
+# Standard library
+# ---------------------------------------------------------------------
+from __future__ import annotations
+
+from typing import Callable
+
+# ---------------------------------------------------------------------
+# Internal application imports
+# ---------------------------------------------------------------------
+from llm_sdk.domain.chat import ChatPart, ChatRequest
+from llm_sdk.domain.embeddings import EmbeddingRequest
+from llm_sdk.exceptions import ValidationError
+
+
+def _has_no_content(part: ChatPart) -> bool:
+    return False
+
+
+# Per-type check for "this part carries usable content".
+_PART_VALIDATORS: dict[str, Callable[[ChatPart], bool]] = {
+    "text": lambda p: bool(p.text) and not p.text.isspace(),
+    "image_url": lambda p: bool(p.url or p.uri),
+    "file_uri": lambda p: bool(p.url or p.uri),
+    "image_bytes": lambda p: bool(p.data),
+}
+
+
+def validate_chat_request(request: ChatRequest) -> None:
+    """
+    Validate chat request.
+
+    Args:
+        request: ChatRequest
+
+    Raises:
+        ValidationError
+    """
+    if not request.messages:
+        raise ValidationError("messages cannot be empty")
+
+    for m in request.messages:
+        # A content-only message is fully frozen, so one that passed before
+        # still passes; chat histories resend every earlier turn with each
+        # request. parts is a mutable list, so those are always re-checked.
+        if getattr(m, "_validated", False):
+            continue
+
+        parts = m.normalized_parts()
+
+        if not parts:
+            raise ValidationError("message parts cannot be empty")
+
+        # any() stops at the first part carrying usable content.
+        if not any(_PART_VALIDATORS.get(p.type, _has_no_content)(p) for p in parts):
+            raise ValidationError("message parts must contain at least one valid part")
+
+        if m.parts is None:
+            object.__setattr__(m, "_validated", True)
+
+    if not 0.0 <= request.temperature <= 2.0:
+        raise ValidationError("temperature must be between 0 and 2")
+
+
+def validate_embedding_request(request: EmbeddingRequest) -> None:
+    """
+    Validate embedding request.
+
+    Args:
+        request: EmbeddingRequest
+
+    Raises:
+        ValidationError
+    """
+    if not request.input:
+        raise ValidationError("input cannot be empty")
+
+    # Plain loop instead of any(<genexpr>): no generator frame per call.
+    # isspace() stops at the first non-blank character and, unlike strip(),
+    # never allocates a copy of the text.
+    for x in request.input:
+        if not x or x.isspace():
+            raise ValidationError("input texts cannot be empty")
@@ -0,0 +1,138 @@
+# ---------------------------------------------------------------------
+# Standard library
+# ---------------------------------------------------------------------
+from __future__ import annotations
+
+# ---------------------------------------------------------------------
+# Third-party libraries
+# ---------------------------------------------------------------------
+import pytest
+
+# ---------------------------------------------------------------------
+# Internal application imports
+# ---------------------------------------------------------------------
+import llm_sdk.providers.async_registry as async_registry
+from llm_sdk.providers.async_registry import ProviderRegistry, ProviderSpec
+
+
+class FakeFactory:
+    spec_calls = 0
+
+    def spec(self) -> ProviderSpec:
+        FakeFactory.spec_calls += 1
+        return ProviderSpec(
+            name="fake",
+            supports_chat=True,
+            supports_embeddings=False,
+            supports_streaming=False,
+            is_async=True,
+        )
+
+
+class FakeEntryPoint:
+    """
+    Entry point whose load() fails `failures` times before succeeding.
+    """
+
+    def __init__(self, name: str, failures: int = 0) -> None:
+        self.name = name
+        self.failures = failures
+        self.loads = 0
+
+
+    def load(self) -> type[FakeFactory]:
+        self.loads += 1
+        if self.loads <= self.failures:
+            raise ImportError(f"cannot import {self.name}")
+        return FakeFactory
+
+
+@pytest.fixture
+def entry_points(monkeypatch: pytest.MonkeyPatch) -> list[FakeEntryPoint]:
+    eps: list[FakeEntryPoint] = []
+    monkeypatch.setattr(async_registry, "_discover_entry_points", lambda group: tuple(eps))
+    FakeFactory.spec_calls = 0
+    return eps
+
+
+def test_plugins_are_imported_on_first_get(entry_points):
+    ep = FakeEntryPoint("fake")
+    entry_points.append(ep)
+
+    reg = ProviderRegistry()
+    reg.load_plugins()
+
+    assert reg.available() == ["fake"]
+    assert ep.loads == 0
+
+    assert isinstance(reg.get("fake"), FakeFactory)
+    reg.get("fake")
+    assert ep.loads == 1
+
+
+def test_eager_load_imports_immediately(entry_points):
+    ep = FakeEntryPoint("fake")
+    entry_points.append(ep)
+
+    ProviderRegistry().load_plugins(eager=True)
+
+    assert ep.loads == 1
+
+
+def test_failed_plugin_import_is_raised_again(entry_points):
+    ep = FakeEntryPoint("fake", failures=2)
+    entry_points.append(ep)
+
+    reg = ProviderRegistry()
+    reg.load_plugins()
+
+    for _ in range(2):
+        with pytest.raises(ImportError, match="cannot import fake"):
+            reg.get("fake")
+
+    assert isinstance(reg.get("fake"), FakeFactory)
+
+
+def test_unknown_provider_lists_available(entry_points):
+    entry_points.append(FakeEntryPoint("fake"))
+    reg = ProviderRegistry()
+    reg.load_plugins()
+
+    with pytest.raises(KeyError, match="Available: fake"):
+        reg.get("missing")
+
+
+def test_spec_is_cached_per_provider(entry_points):
+    entry_points.append(FakeEntryPoint("fake"))
+    reg = ProviderRegistry()
+    reg.load_plugins()
+
+    assert reg.spec("fake") is reg.spec("fake")
+    assert FakeFactory.spec_calls == 1
+
+
+def test_entry_point_name_differing_from_spec_name(entry_points):
+    ep = FakeEntryPoint("fake-plugin")
+    entry_points.append(ep)
+    reg = ProviderRegistry()
+    reg.load_plugins()
+
+    factory = reg.get("fake-plugin")
+
+    assert reg.get("fake") is factory
+    assert reg.spec("fake-plugin") is reg.spec("fake")
+    assert reg.available() == ["fake"]
+    assert ep.loads == 1
+
+
+def test_spec_name_of_a_deferred_plugin_loads_it(entry_points):
+    entry_points.append(FakeEntryPoint("broken", failures=2))
+    entry_points.append(FakeEntryPoint("fake-plugin"))
+    reg = ProviderRegistry()
+    reg.load_plugins()
+
+    assert isinstance(reg.get("fake"), FakeFactory)
+
+    # The plugin that failed to import stays deferred and reports its error.
+    with pytest.raises(ImportError, match="cannot import broken"):
+        reg.get("broken")
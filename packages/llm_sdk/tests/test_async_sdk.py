@@ -0,0 +1,159 @@
+# ---------------------------------------------------------------------
+# Standard library
+# ---------------------------------------------------------------------
+from __future__ import annotations
+
+import asyncio
+
+# ---------------------------------------------------------------------
+# Third-party libraries
+# ---------------------------------------------------------------------
+import httpx
+import pytest
+
+# ---------------------------------------------------------------------
+# Internal application imports
+# ---------------------------------------------------------------------
+import llm_sdk.providers.async_registry as async_registry
+from llm_sdk.async_sdk import AsyncLLM
+from llm_sdk.exceptions import ValidationError
+from llm_sdk.providers.async_base import AsyncBaseLLMClient
+from llm_sdk.providers.async_registry import ProviderRegistry, ProviderSpec
+from llm_sdk.settings import SDKSettings
+
+
+class ChatOnlyFactory:
+    """
+    Factory for a chat-only provider that counts create() calls.
+    """
+
+    creates = 0
+
+    def spec(self) -> ProviderSpec:
+        return ProviderSpec(
+            name="fake",
+            supports_chat=True,
+            supports_embeddings=False,
+            supports_streaming=False,
+            is_async=True,
+        )
+
+
+    def create(self, settings, http_client=None):
+        ChatOnlyFactory.creates += 1
+        raise AssertionError("client must not be built for a rejected request")
+
+
+@pytest.fixture
+def llm() -> AsyncLLM:
+    ChatOnlyFactory.creates = 0
+    registry = ProviderRegistry()
+    factory = ChatOnlyFactory()
+    registry._factories["fake"] = factory
+    registry._specs["fake"] = factory.spec()
+    settings = SDKSettings(default_provider="fake", default_model="fake-model")
+    return AsyncLLM(registry=registry, settings=settings)
+
+
+def test_invalid_chat_request_does_not_build_client(llm):
+    with pytest.raises(ValidationError):
+        asyncio.run(llm.chat(messages=[]))
+
+    assert ChatOnlyFactory.creates == 0
+
+
+def test_unsupported_capability_does_not_build_client(llm):
+    with pytest.raises(ValidationError):
+        asyncio.run(llm.embed(input=["hello"]))
+
+    async def drain() -> None:
+        async for _ in llm.stream_chat(messages=[("user", "hi")]):
+            pass
+
+    with pytest.raises(ValidationError):
+        asyncio.run(drain())
+
+    assert ChatOnlyFactory.creates == 0
+
+
+class FakeClient(AsyncBaseLLMClient):
+    def __init__(self, http_client: httpx.AsyncClient | None = None) -> None:
+        self.http_client = http_client
+
+
+    @property
+    def provider_name(self) -> str:
+        return "fake"
+
+
+    async def chat(self, request):
+        raise NotImplementedError
+
+
+    async def embed(self, request):
+        raise NotImplementedError
+
+
+class LegacyFactory(ChatOnlyFactory):
+    """
+    Factory written before create() took http_client.
+    """
+
+    def create(self, settings):
+        return FakeClient()
+
+
+class PooledFactory(ChatOnlyFactory):
+    def create(self, settings, http_client=None):
+        return FakeClient(http_client)
+
+
+def _llm(factory, http_client=None) -> AsyncLLM:
+    registry = ProviderRegistry()
+    registry._factories["fake"] = factory
+    registry._specs["fake"] = factory.spec()
+    settings = SDKSettings(default_provider="fake", default_model="fake-model")
+    return AsyncLLM(registry=registry, settings=settings, http_client=http_client)
+
+
+def test_factory_without_http_client_parameter_still_works():
+    async def run():
+        async with httpx.AsyncClient() as http:
+            return _llm(LegacyFactory(), http_client=http)._get_provider_client("fake")
+
+    assert isinstance(asyncio.run(run()), FakeClient)
+
+
+def test_shared_http_client_is_passed_when_accepted():
+    async def run():
+        async with httpx.AsyncClient() as http:
+            client = _llm(PooledFactory(), http_client=http)._get_provider_client("fake")
+            return client.http_client is http
+
+    assert asyncio.run(run())
+
+
+class PooledEntryPoint:
+    name = "fake"
+
+    def load(self) -> type[PooledFactory]:
+        return PooledFactory
+
+
+@pytest.mark.parametrize("warmup", [False, True])
+def test_default_warmup_creates_clients(monkeypatch, warmup):
+    monkeypatch.setattr(async_registry, "_discover_entry_points", lambda group: (PooledEntryPoint(),))
+
+    async def run():
+        llm = AsyncLLM.default(load_plugins=True, warmup=warmup)
+        try:
+            return llm.resources.get_cached("fake")
+        finally:
+            await llm.aclose()
+
+    cached = asyncio.run(run())
+
+    if warmup:
+        assert isinstance(cached, FakeClient)
+    else:
+        assert cached is None
@@ -0,0 +1,58 @@
+# ---------------------------------------------------------------------
+# Standard library
+# ---------------------------------------------------------------------
+import dataclasses
+
+# ---------------------------------------------------------------------
+# Third-party libraries
+# ---------------------------------------------------------------------
+import pytest
+
+# ---------------------------------------------------------------------
+# Internal application imports
+# ---------------------------------------------------------------------
+from llm_sdk.domain.chat import ChatMessage, ChatPart, ChatRequest
+from llm_sdk.exceptions import ValidationError
+from llm_sdk.utils.message_utils import _normalized_messages
+from llm_sdk.validators import validate_chat_request
+
+
+def test_memo_slots_are_not_dataclass_fields():
+    msg = ChatMessage(role="user", content="hola")
+    validate_chat_request(ChatRequest(model="m", messages=[msg]))
+
+    assert [f.name for f in dataclasses.fields(msg)] == ["role", "content", "parts"]
+    assert dataclasses.asdict(msg) == {"role": "user", "content": "hola", "parts": None}
+    assert repr(msg) == "ChatMessage(role='user', content='hola', parts=None)"
+
+
+def test_normalized_parts_builds_the_text_part_once():
+    msg = ChatMessage(role="user", content="hola")
+
+    assert msg.normalized_parts() is msg.normalized_parts()
+    assert msg.normalized_parts()[0].text == "hola"
+
+
+def test_parts_are_revalidated_after_they_change():
+    msg = ChatMessage(role="user", parts=[ChatPart.from_text("hola")])
+    validate_chat_request(ChatRequest(model="m", messages=[msg]))
+
+    msg.parts.clear()
+    msg.parts.append(ChatPart.from_text(""))
+
+    with pytest.raises(ValidationError):
+        validate_chat_request(ChatRequest(model="m", messages=[msg]))
+
+
+def test_tuple_messages_build_fresh_messages():
+    first = _normalized_messages([("system", "Eres un profesor")])[0]
+    second = _normalized_messages([("system", "Eres un profesor")])[0]
+
+    assert first == second
+    assert first is not second
+
+
+@pytest.mark.parametrize("message", [("user", ["hola"]), ("user", {"text": "hola"}), (1, "hola")])
+def test_non_string_tuple_items_raise_validation_error(message):
+    with pytest.raises(ValidationError):
+        _normalized_messages([message])
@@ -0,0 +1,54 @@
+# ---------------------------------------------------------------------
+# Third-party libraries
+# ---------------------------------------------------------------------
+import pytest
+
+# ---------------------------------------------------------------------
+# Internal application imports
+# ---------------------------------------------------------------------
+from llm_sdk.exceptions import ModelNotFoundError, ProviderNotFoundError
+from llm_sdk.providers.noop_client import NoopLLMClient
+from llm_sdk.providers.sync_registry import ProviderRegistry, ProviderSpec
+
+
+def _spec(name: str = "noop", models: set[str] | None = None) -> ProviderSpec:
+    return ProviderSpec(name=name, factory=NoopLLMClient, models=models or {"noop-model"})
+
+
+def test_register_does_not_modify_the_given_spec():
+    spec = _spec()
+    name, models = spec.name, spec.models
+
+    ProviderRegistry().register(spec)
+
+    assert spec.name is name
+    assert spec.models is models
+
+
+def test_get_and_resolve_model():
+    reg = ProviderRegistry()
+    reg.register(_spec())
+
+    assert reg.get("noop").name == "noop"
+    assert reg.resolve_model("noop", "noop-model") == "noop-model"
+
+    with pytest.raises(ProviderNotFoundError):
+        reg.get("missing")
+
+    with pytest.raises(ModelNotFoundError):
+        reg.resolve_model("noop", "other-model")
+
+
+def test_register_invalidates_resolved_models_and_sorted_names():
+    reg = ProviderRegistry()
+    reg.register(_spec("b"))
+    reg.resolve_model("b", "noop-model")
+    assert reg.list_providers() == ["b"]
+
+    # Re-registering "b" without the model must not keep the old answer.
+    reg.register(_spec("b", {"other"}))
+    reg.register(_spec("a"))
+
+    with pytest.raises(ModelNotFoundError):
+        reg.resolve_model("b", "noop-model")
+    assert reg.list_providers() == ["a", "b"]
@@ -0,0 +1,150 @@
+# ---------------------------------------------------------------------
+# Standard library
+# ---------------------------------------------------------------------
+import asyncio
+import random
+
+# ---------------------------------------------------------------------
+# Third-party libraries
+# ---------------------------------------------------------------------
+import pytest
+
+# ---------------------------------------------------------------------
+# Internal application imports
+# ---------------------------------------------------------------------
+from llm_sdk.exceptions import ProviderError, TimeoutError
+from llm_sdk.retries import RetryPolicy, with_async_retries, with_retries
+
+
+POLICY = RetryPolicy(max_attempts=3, base_delay_s=0.01, max_delay_s=0.01)
+
+
+class Flaky:
+    """
+    Callable failing with a ProviderError until `failures` calls were made.
+    """
+
+    def __init__(self, failures: int, retryable: bool = True) -> None:
+        self.failures = failures
+        self.retryable = retryable
+        self.calls = 0
+
+
+    def __call__(self) -> str:
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise ProviderError("fake", f"boom {self.calls}", is_retryable=self.retryable)
+        return "ok"
+
+
+    async def acall(self) -> str:
+        return self()
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    recorded: list[float] = []
+
+    async def _async_sleep(delay: float) -> None:
+        recorded.append(delay)
+
+    monkeypatch.setattr("llm_sdk.retries.time.sleep", recorded.append)
+    monkeypatch.setattr("llm_sdk.retries.asyncio.sleep", _async_sleep)
+    return recorded
+
+
+def test_sync_retries_until_success(sleeps):
+    fn = Flaky(failures=2)
+
+    assert with_retries(fn, provider="fake", retry_policy=POLICY) == "ok"
+    assert fn.calls == 3
+    assert len(sleeps) == 2
+
+
+def test_async_retries_until_success(sleeps):
+    fn = Flaky(failures=2)
+
+    assert asyncio.run(with_async_retries(fn.acall, provider="fake", retry_policy=POLICY)) == "ok"
+    assert fn.calls == 3
+    assert len(sleeps) == 2
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_exhausted_retries_raise_timeout_without_final_sleep(sleeps, use_async):
+    fn = Flaky(failures=10)
+
+    with pytest.raises(TimeoutError) as info:
+        if use_async:
+            asyncio.run(with_async_retries(fn.acall, provider="fake", retry_policy=POLICY))
+        else:
+            with_retries(fn, provider="fake", retry_policy=POLICY)
+
+    assert info.value.provider == "fake"
+    assert isinstance(info.value.last_error, ProviderError)
+    assert info.value.last_error.message == "boom 3"
+    assert fn.calls == 3
+    assert len(sleeps) == 2
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_non_retryable_error_is_raised_immediately(sleeps, use_async):
+    fn = Flaky(failures=1, retryable=False)
+
+    with pytest.raises(ProviderError):
+        if use_async:
+            asyncio.run(with_async_retries(fn.acall, provider="fake", retry_policy=POLICY))
+        else:
+            with_retries(fn, provider="fake", retry_policy=POLICY)
+
+    assert fn.calls == 1
+    assert sleeps == []
+
+
+def _seeded(policy: RetryPolicy, seed: int = 0) -> RetryPolicy:
+    object.__setattr__(policy, "_rng", random.Random(seed))
+    return policy
+
+
+def test_backoff_schedule_doubles_up_to_the_cap():
+    policy = RetryPolicy(max_attempts=5, base_delay_s=0.25, max_delay_s=1.5)
+
+    assert policy._backoff == (0.25, 0.5, 1.0, 1.5, 1.5)
+
+
+def test_equal_jitter_stays_within_half_to_full_backoff():
+    policy = _seeded(RetryPolicy(max_attempts=4, base_delay_s=0.25, max_delay_s=3.0))
+
+    for attempt, backoff in enumerate(policy._backoff):
+        for _ in range(50):
+            assert backoff / 2 <= policy.compute_delay(attempt) < backoff
+
+    # Attempts past the precomputed schedule use the cap.
+    assert 1.5 <= policy.compute_delay(10) < 3.0
+
+
+def test_seeded_jitter_is_reproducible():
+    first = _seeded(RetryPolicy(), seed=42)
+    second = _seeded(RetryPolicy(), seed=42)
+
+    assert [first.compute_delay(a) for a in range(3)] == [second.compute_delay(a) for a in range(3)]
+
+
+def test_decorrelated_jitter_is_bounded_by_previous_delay():
+    policy = _seeded(RetryPolicy(base_delay_s=0.1, max_delay_s=2.0, jitter="decorrelated"))
+
+    delay = None
+    for attempt in range(20):
+        prev = delay
+        delay = policy.compute_delay(attempt, prev)
+
+        assert 0.1 <= delay <= 2.0
+        assert delay <= (prev or 0.1) * 3
+
+
+def test_sync_sleeps_use_the_policy_delays(sleeps):
+    policy = _seeded(RetryPolicy(max_attempts=3, base_delay_s=0.2, max_delay_s=1.0))
+    expected = _seeded(RetryPolicy(max_attempts=3, base_delay_s=0.2, max_delay_s=1.0))
+
+    with_retries(Flaky(failures=2), provider="fake", retry_policy=policy)
+
+    assert sleeps == [expected.compute_delay(0), expected.compute_delay(1)]
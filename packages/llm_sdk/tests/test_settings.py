@@ -0,0 +1,46 @@
+# ---------------------------------------------------------------------
+# Third-party libraries
+# ---------------------------------------------------------------------
+import pytest
+
+# ---------------------------------------------------------------------
+# Internal application imports
+# ---------------------------------------------------------------------
+from llm_sdk.settings import load_settings, reset_settings
+
+
+@pytest.fixture(autouse=True)
+def fresh_settings():
+    reset_settings()
+    yield
+    reset_settings()
+
+
+def test_load_settings_is_cached():
+    assert load_settings() is load_settings()
+
+
+def test_overrides_bypass_the_cache():
+    cached = load_settings()
+    custom = load_settings(default_model="other-model")
+
+    assert custom is not cached
+    assert custom.default_model == "other-model"
+    assert load_settings() is cached
+
+
+def test_reset_settings_rereads_the_environment(monkeypatch):
+    monkeypatch.setenv("LLM_SDK_DEFAULT_MODEL", "first-model")
+    assert load_settings().default_model == "first-model"
+
+    monkeypatch.setenv("LLM_SDK_DEFAULT_MODEL", "second-model")
+    assert load_settings().default_model == "first-model"
+
+    reset_settings()
+    assert load_settings().default_model == "second-model"
+
+
+def test_gemini_settings_read_env_at_load_time(monkeypatch):
+    monkeypatch.setenv("LLM_SDK_GEMINI_RESPONSE_CACHE_SIZE", "32")
+
+    assert load_settings().gemini.response_cache_size == 32
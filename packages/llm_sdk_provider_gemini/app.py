@@ -1,8 +1,8 @@
+import argparse
 import asyncio
 from dataclasses import replace
 
 from logger.logger import Logger
-from google.genai.types import GenerateContentConfig
 
 from llm_sdk.providers.sync_registry import ProviderSpec
 from llm_sdk import SyncLLM, AsyncLLM
@@ -11,8 +11,20 @@ from llm_sdk.domain.chat import ChatMessage, ChatPart
 
 from llm_sdk.retries import RetryPolicy
 
-async def main() -> None:
-    sdk = AsyncLLM.default(load_plugins=True, logger=logger)
+
+# Built once at import; shared by every example call.
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "summary": {"type": "string"},
+        "sentiment": {"type": "string", "enum": ["positive", "neutral", "negative"]},
+    },
+    "required": ["summary", "sentiment"],
+}
+
+
+async def main(logger: Logger | None = None) -> None:
+    sdk = AsyncLLM.default(load_plugins=True, logger=logger, warmup=True)
 
     retry_policy = RetryPolicy(
         max_attempts=3,
@@ -21,15 +33,6 @@ async def main() -> None:
 
     sdk = replace(sdk, retry_policy=retry_policy)
 
-    schema = {
-        "type": "object",
-        "properties": {
-            "summary": {"type": "string"},
-            "sentiment": {"type": "string", "enum": ["positive", "neutral", "negative"]},
-        },
-        "required": ["summary", "sentiment"],
-    }
-
     resp = await sdk.chat(
         messages=[
             ChatMessage(
@@ -48,7 +51,7 @@ async def main() -> None:
         ],
         provider="gemini",
         model="gemini-2.5-flash",
-        output_schema=schema,
+        output_schema=SCHEMA,
     )
 
     text_out: list[str] = []
@@ -69,7 +72,7 @@ async def main() -> None:
         ],
         provider="gemini",
         model="gemini-2.5-flash",
-        output_schema=schema,
+        output_schema=SCHEMA,
     ):
         if ev.delta:
             print(ev.delta, end="", flush=True)
@@ -85,7 +88,7 @@ async def main() -> None:
     print("full text:", full_text)
 
 
-def main_sync() -> None:
+def main_sync(logger: Logger | None = None) -> None:
     sdk = SyncLLM.default(logger=logger)
 
     sdk.registry.register(ProviderSpec(
@@ -96,15 +99,6 @@ def main_sync() -> None:
         models={"gemini-2.5-flash", "text-multilingual-embedding-002"},
     ))
 
-    schema = {
-        "type": "object",
-        "properties": {
-            "summary": {"type": "string"},
-            "sentiment": {"type": "string", "enum": ["positive", "neutral", "negative"]},
-        },
-        "required": ["summary", "sentiment"],
-    }
-
     print(
         sdk.embed(
             provider="gemini",
@@ -131,7 +125,7 @@ def main_sync() -> None:
     #     ],
     #     provider="gemini",
     #     model="gemini-2.5-flash",
-    #     output_schema=schema,
+    #     output_schema=SCHEMA,
     # )
 
     # print(resp.content)
@@ -153,7 +147,7 @@ def main_sync() -> None:
     #     ],
     #     provider="gemini",
     #     model="gemini-2.5-flash",
-    #     output_schema=schema,
+    #     output_schema=SCHEMA,
     # ):
     #     if ev.delta:
     #         text_out.append(ev.delta)
@@ -168,10 +162,16 @@ def main_sync() -> None:
     # print("full text:", full_text)
 
 
-Logger().configure()
-logger = Logger()
-
-
 if __name__ == "__main__":
-    main_sync()
-    # asyncio.run(main())
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="llm_sdk Gemini examples")
+    parser.add_argument("--async", dest="use_async", action="store_true", help="run the async example")
+    args = parser.parse_args()
+
+    # Configure logging only when run as a script, never on import.
+    Logger().configure()
+    logger = Logger()
+
+    if args.use_async:
+        asyncio.run(main(logger))
+    else:
+        main_sync(logger)
@@ -3,26 +3,53 @@
 # ---------------------------------------------------------------------
 from __future__ import annotations
 
-from typing import Any, AsyncIterator
+import asyncio
+import contextlib
+import json
+import logging
+from typing import Any, AsyncIterator, Awaitable, Callable
 
 # ---------------------------------------------------------------------
 # Third-party libraries
 # ---------------------------------------------------------------------
+import httpx
 from google import genai
-from google.auth import default
-from google.genai.types import Content, Part
+from google.genai.types import Content, HttpOptions
 
 # ---------------------------------------------------------------------
 # Internal application imports
 # ---------------------------------------------------------------------
 from llm_sdk.domain.chat import ChatMessage, ChatRequest, ChatResponse, ChatStreamEvent
 from llm_sdk.domain.embeddings import EmbeddingRequest, EmbeddingResponse
-from llm_sdk.exceptions import ProviderError, ValidationError
+from llm_sdk.exceptions import ProviderError
 from llm_sdk.providers.async_base import AsyncBaseLLMClient
 from llm_sdk.timeouts import TimeoutConfig
 
 from llm_sdk.utils.message_utils import extract_token_usage
 
+from llm_sdk_provider_gemini.contents import _PROVIDER, to_gemini_contents, to_generation_config
+from llm_sdk_provider_gemini.credentials import get_credentials
+from llm_sdk_provider_gemini.embedding_cache import EmbeddingCache
+from llm_sdk_provider_gemini.response_cache import ResponseCache, request_key
+from llm_sdk_provider_gemini.semantic_cache import SemanticCache
+
+
+_log = logging.getLogger(__name__)
+
+
+# Embedding values are returned as EmbeddingResponse.vectors; copying them
+# into raw as well would double the cost of every embed call.
+_EMBED_RAW_EXCLUDE = {"embeddings": {"__all__": {"values"}}}
+
+
+def _embedding_values(e: Any) -> list[float]:
+    values = getattr(e, "values", None)
+    if values is None:
+        values = getattr(e, "embedding", None)
+    # google-genai already hands back list[float]; only copy other
+    # sequence types.
+    return values if type(values) is list else list(values or [])
+
 
 class AsyncGeminiLLMClient(AsyncBaseLLMClient):
     """
@@ -40,25 +67,75 @@ class AsyncGeminiLLMClient(AsyncBaseLLMClient):
         location: str,
         scope: list[str] | None = None,
         timeouts: TimeoutConfig,
+        http_client: httpx.AsyncClient | None = None,
+        embedding_cache_size: int = 10_000,
+        embedding_batch_size: int = 100,
+        response_cache_size: int = 0,
+        semantic_cache: SemanticCache | None = None,
+        semantic_cache_model: str = "text-multilingual-embedding-002",
+        stream_flush_ms: float = 50.0,
+        stream_max_batch: int = 50,
+        max_concurrent_requests: int = 30,
     ) -> None:
-        self._credentials, self._project = default(scopes=scope)
+        self._credentials, self._project = get_credentials(tuple(scope or ()))
         self._location = location
         self._timeouts = timeouts
 
+        # Reuse the SDK-owned connection pool when one is provided.
+        http_options = None
+        if http_client is not None:
+            http_options = HttpOptions(httpx_async_client=http_client)
+
         self._client = genai.Client(
             vertexai=True,
             project=self._project,
             location=self._location,
             credentials=self._credentials,
+            http_options=http_options,
         )
 
         # Async client handle
         self._aio = self._client.aio
 
+        # Coalesces concurrent embed_one() calls into batched requests.
+        self._batcher = _BatchEmbedder(self._embed_texts)
+
+        # Vectors of recently embedded texts; 0 disables caching.
+        self._emb_cache = EmbeddingCache(embedding_cache_size)
+        self._embed_batch_size = embedding_batch_size
+
+        # Optional: answer repeated identical requests; 0 disables it.
+        self._response_cache = ResponseCache(response_cache_size)
+
+        # Optional: answer near-duplicate text prompts from earlier responses.
+        self._semantic_cache = semantic_cache
+        self._semantic_cache_model = semantic_cache_model
+
+        # Caps in-flight provider calls so bursts queue here instead of
+        # opening ever more connections; 0 disables the cap.
+        self._limiter: asyncio.Semaphore | contextlib.nullcontext[None] = (
+            asyncio.Semaphore(max_concurrent_requests)
+            if max_concurrent_requests
+            else contextlib.nullcontext()
+        )
+
+        # Stream chunks are merged into one event per flush window.
+        self._stream_flush_s = stream_flush_ms / 1000
+        self._stream_max_batch = stream_max_batch
+
 
     @property
     def provider_name(self) -> str:
-        return "gemini"
+        return _PROVIDER
+
+
+    async def aclose(self) -> None:
+        """
+        Stop the embedding batcher.
+
+        The shared HTTP client is owned (and closed) by the SDK.
+        """
+        await self._batcher.aclose()
 
 
     async def chat(self, request: ChatRequest) -> ChatResponse:
@@ -68,24 +145,49 @@ class AsyncGeminiLLMClient(AsyncBaseLLMClient):
         Args:
             request: ChatRequest with model, messages and optional params.
 
+        With a response cache configured, a request identical to an earlier
+        one gets that earlier response. With a semantic cache configured,
+        text-only prompts similar enough to an earlier one do too.
+
         Returns:
             ChatResponse with normalized content, usage and raw provider payload.
         """
+        exact_key = request_key(request) if self._response_cache.enabled else None
+
+        if exact_key is not None:
+            hit = self._response_cache.get(exact_key)
+            if hit is not None:
+                return hit
+
+        semantic_key = self._semantic_key(request) if self._semantic_cache is not None else None
+
+        if semantic_key is not None:
+            namespace, prompt = semantic_key
+
+            # The cache is only an optimisation: if embedding the prompt (or
+            # the lookup) fails, answer from the model and skip the cache.
+            try:
+                query = (await self._embed_texts(self._semantic_cache_model, [prompt]))[0]
+                hit = self._semantic_cache.lookup(namespace, query)
+            except Exception as e:
+                _log.warning("semantic cache lookup failed, skipping cache: %s", e)
+                semantic_key = None
+                hit = None
+
+            if hit is not None:
+                return hit
+
         contents = self._to_gemini_contents(request.messages)
 
-        try:
-            resp = await self._aio.models.generate_content(
-                model=request.model,
-                contents=contents,
-                config={
-                    "temperature": request.temperature,
-                    "max_output_tokens": request.max_output_tokens,
-                    "response_schema": request.output_schema,
-                    "response_mime_type": request.output_mime_type,
-                },
-            )
-        except Exception as e:
-            raise ProviderError("gemini", f"provider error: {e}", is_retryable=True) from e
+        async with self._limiter:
+            try:
+                resp = await self._aio.models.generate_content(
+                    model=request.model,
+                    contents=contents,
+                    config=to_generation_config(request),
+                )
+            except Exception as e:
+                raise ProviderError(_PROVIDER, f"provider error: {e}", is_retryable=True) from e
 
         text = getattr(resp, "text", None)
         if not text:
@@ -94,13 +196,27 @@ class AsyncGeminiLLMClient(AsyncBaseLLMClient):
         usage = extract_token_usage(resp)
         raw = self._safe_raw(resp)
 
-        return ChatResponse(model=request.model, content=text or "", usage=usage, raw=raw)
+        response = ChatResponse(model=request.model, content=text or "", usage=usage, raw=raw)
+
+        if exact_key is not None:
+            self._response_cache.put(exact_key, response)
+
+        if semantic_key is not None:
+            self._semantic_cache.store(namespace, query, response)
+
+        return response
 
 
     async def stream_chat(self, request: ChatRequest) -> AsyncIterator[ChatStreamEvent]:
         """
         Stream chat completion deltas as they arrive.
 
+        Chunks are coalesced: the first one is emitted on its own, then
+        batches grow (x3, up to stream_max_batch chunks) and are flushed
+        at the latest stream_flush_ms after their first chunk arrived.
+        This cuts per-event overhead on fast streams without delaying the
+        first token.
+
         Args:
             request: ChatRequest.
 
@@ -109,126 +225,223 @@ class AsyncGeminiLLMClient(AsyncBaseLLMClient):
         """
         contents = self._to_gemini_contents(request.messages)
 
-        try:
-            stream = await self._aio.models.generate_content_stream(
-                model=request.model,
-                contents=contents,
-                config={
-                    "temperature": request.temperature,
-                    "max_output_tokens": request.max_output_tokens,
-                    "response_schema": request.output_schema,
-                    "response_mime_type": request.output_mime_type,
-                },
-            )
-        except Exception as e:
-            raise ProviderError("gemini", f"provider error: {e}", is_retryable=True) from e
+        # Held for the whole stream: the connection is busy until it ends.
+        async with self._limiter:
+            try:
+                stream = await self._aio.models.generate_content_stream(
+                    model=request.model,
+                    contents=contents,
+                    config=to_generation_config(request),
+                )
+            except Exception as e:
+                raise ProviderError(_PROVIDER, f"provider error: {e}", is_retryable=True) from e
 
-        last_usage = None
+            last_usage = None
 
-        try:
-            for chunk in stream:
-                usage = extract_token_usage(chunk) or last_usage
-                if usage is not None:
-                    last_usage = usage
+            try:
+                async for chunks in _batched(stream, self._stream_flush_s, self._stream_max_batch):
+                    deltas: list[str] = []
 
-                delta = getattr(chunk, "text", None)
-                if delta:
-                    yield ChatStreamEvent(delta=delta, done=False, usage=usage)
+                    for chunk in chunks:
+                        usage = extract_token_usage(chunk)
+                        if usage is not None:
+                            last_usage = usage
 
-            yield ChatStreamEvent(delta="", done=True, usage=last_usage)
+                        delta = getattr(chunk, "text", None)
+                        if delta:
+                            deltas.append(delta)
 
-        except Exception as e:
-            raise ProviderError("gemini", f"stream error: {e}", is_retryable=True) from e
+                    if deltas:
+                        yield ChatStreamEvent(delta="".join(deltas), done=False, usage=last_usage)
+
+                yield ChatStreamEvent(delta="", done=True, usage=last_usage)
+
+            except Exception as e:
+                raise ProviderError(_PROVIDER, f"stream error: {e}", is_retryable=True) from e
 
 
     async def embed(self, request: EmbeddingRequest) -> EmbeddingResponse:
         """
         Generate embeddings.
 
+        Texts embedded recently with the same model are served from an
+        in-process LRU cache; only the rest are sent to the provider.
+
         Args:
             request: EmbeddingRequest with model and input texts.
 
         Returns:
             EmbeddingResponse with vectors aligned with input order.
         """
-        try:
-            resp = await self._aio.models.embed_content(
-                model=request.model,
-                contents=request.input,
-            )
-        except Exception as e:
-            raise ProviderError("gemini", f"provider error: {e}", is_retryable=True) from e
+        vectors, resps = await self._embed_cached(request.model, request.input)
 
-        vectors = self._extract_embeddings(resp)
-        raw = self._safe_raw(resp)
+        if len(resps) == 1:
+            raw = self._safe_raw(resps[0], _EMBED_RAW_EXCLUDE)
+        else:
+            raw = {"batches": [self._safe_raw(r, _EMBED_RAW_EXCLUDE) for r in resps]} if resps else {}
 
         return EmbeddingResponse(model=request.model, vectors=vectors, raw=raw)
 
+
+    async def embed_one(self, text: str, *, model: str) -> list[float]:
+        """
+        Embed a single text.
+
+        Concurrent calls arriving within a short window are sent as one
+        embed_content request, so callers embedding texts one by one don't
+        pay one round trip each.
+
+        Args:
+            text: Input text.
+            model: Embedding model.
+
+        Returns:
+            The embedding vector.
+        """
+        return await self._batcher.submit(model, text)
+
     # -------------------------
     # Helpers
     # -------------------------
 
-    def _to_gemini_contents(self, messages: list[ChatMessage]) -> list[Content]:
+    def _semantic_key(self, request: ChatRequest) -> tuple[tuple[Any, ...], str] | None:
         """
-        Convert SDK messages into Gemini Contents.
+        Build the semantic cache namespace and prompt text for a request.
 
-        Supports:
-        - text
-        - image_url (as URI)
-        - file_uri
-        - image_bytes
+        Only text-only conversations are cached; the namespace holds every
+        setting that changes the answer, so hits never cross them.
 
         Args:
-            messages: List of ChatMessage from SDK domain.
+            request: ChatRequest.
 
         Returns:
-            List of Gemini Content objects.
+            (namespace, prompt) or None if the request is not cacheable.
         """
-        contents: list[Content] = []
+        lines: list[str] = []
+        for msg in request.messages:
+            for part in msg.normalized_parts():
+                if part.type != "text":
+                    return None
+                lines.append(f"{msg.role}: {part.text or ''}")
+
+        schema = json.dumps(request.output_schema, sort_keys=True) if request.output_schema else None
+        namespace = (
+            request.model,
+            request.temperature,
+            request.max_output_tokens,
+            request.output_mime_type,
+            schema,
+        )
+        return namespace, "\n".join(lines)
 
-        for msg in messages:
-            role = msg.role
 
-            parts_out: list[Part] = []
+    async def _embed_content(self, model: str, texts: list[str]) -> Any:
+        """
+        Call embed_content, mapping failures to ProviderError.
 
-            for part in msg.normalized_parts():
+        Args:
+            model: Embedding model.
+            texts: Input texts.
 
-                if part.type == "text":
-                    parts_out.append(Part.from_text(text=part.text or ""))
-                    continue
+        Returns:
+            Provider response.
+        """
+        async with self._limiter:
+            try:
+                return await self._aio.models.embed_content(model=model, contents=texts)
+            except Exception as e:
+                raise ProviderError(_PROVIDER, f"provider error: {e}", is_retryable=True) from e
 
-                elif part.type == "image_url":
-                    uri = (part.url or part.uri or "").strip()
-                    if not uri:
-                        raise ValidationError("image_url part requires 'url' or 'uri'")
-                    parts_out.append(Part.from_uri(file_uri=uri))
-                    continue
 
-                elif part.type == "file_uri":
-                    uri = (part.url or part.uri or "").strip()
-                    if not uri:
-                        raise ValidationError("file_uri part requires 'url' or 'uri'")
-                    parts_out.append(Part.from_uri(file_uri=uri))
-                    continue
+    async def _embed_texts(self, model: str, texts: list[str]) -> list[list[float]]:
+        """
+        Embed texts and return only the vectors (used by the batcher).
 
-                elif part.type == "image_bytes":
-                    if not part.mime_type:
-                        raise ValidationError("image_bytes part requires 'mime_type'")
-                    if not part.data:
-                        raise ValidationError("image_bytes part requires 'data'")
+        Args:
+            model: Embedding model.
+            texts: Input texts.
 
-                    parts_out.append(Part.from_bytes(
-                        data=part.data,
-                        mime_type=part.mime_type,
-                    ))
-                    continue
+        Returns:
+            list[list[float]] aligned with texts.
+        """
+        vectors, _ = await self._embed_cached(model, texts)
+        return vectors
+
+
+    async def _embed_cached(
+        self,
+        model: str,
+        texts: list[str],
+    ) -> tuple[list[list[float]], list[Any]]:
+        """
+        Embed texts, calling the provider only for cache misses (each
+        distinct text once).
 
-                else:
-                    raise ProviderError("gemini", f"unsupported part type: {part.type}", is_retryable=False)
+        Misses beyond the per-call limit are split into batches that are
+        sent concurrently (still bounded by the client's request limiter).
 
-            contents.append(Content(role=role, parts=parts_out))
+        Args:
+            model: Embedding model.
+            texts: Input texts.
 
-        return contents
+        Returns:
+            (vectors aligned with texts, provider responses; empty if every
+            text was cached)
+        """
+        cache = self._emb_cache
+        vectors: list[list[float] | None] = [cache.get(model, t) for t in texts]
+        missing = [i for i, v in enumerate(vectors) if v is None]
+
+        if not missing:
+            return vectors, []
+
+        # Texts repeated within the call are sent once.
+        slots: dict[str, int] = {}
+        order = [slots.setdefault(texts[i], len(slots)) for i in missing]
+        pending = list(slots)
+        size = self._embed_batch_size
+
+        if len(pending) <= size:
+            resps = [await self._embed_content(model, pending)]
+        else:
+            resps = await asyncio.gather(*(
+                self._embed_content(model, pending[j:j + size])
+                for j in range(0, len(pending), size)
+            ))
+
+        fresh = [v for r in resps for v in self._extract_embeddings(r)]
+
+        if len(fresh) != len(pending):
+            raise ProviderError(
+                _PROVIDER,
+                f"expected {len(pending)} embeddings, got {len(fresh)}",
+                is_retryable=True,
+            )
+
+        for text, vector in zip(pending, fresh):
+            cache.put(model, text, vector)
+
+        # Repeats get their own copy, so mutating one vector never changes
+        # another position.
+        used = [False] * len(fresh)
+        for i, j in zip(missing, order):
+            vectors[i] = list(fresh[j]) if used[j] else fresh[j]
+            used[j] = True
+
+        return vectors, resps
+
+
+    def _to_gemini_contents(self, messages: list[ChatMessage]) -> list[Content]:
+        """
+        Convert SDK messages into Gemini Contents.
+
+        Args:
+            messages: List of ChatMessage from SDK domain.
+
+        Returns:
+            List of Gemini Content objects.
+        """
+        return to_gemini_contents(messages)
 
 
     def _extract_embeddings(self, resp: Any) -> list[list[float]]:
@@ -243,17 +456,11 @@ class AsyncGeminiLLMClient(AsyncBaseLLMClient):
         """
         embeddings = getattr(resp, "embeddings", None)
         if embeddings:
-            out: list[list[float]] = []
-            for e in embeddings:
-                values = getattr(e, "values", None)
-                if values is None:
-                    values = getattr(e, "embedding", None)
-                out.append(list(values or []))
-            return out
+            return [_embedding_values(e) for e in embeddings]
 
         values = getattr(resp, "values", None)
         if values:
-            return [list(values)]
+            return [values if type(values) is list else list(values)]
 
         return []
 
@@ -278,20 +485,17 @@ class AsyncGeminiLLMClient(AsyncBaseLLMClient):
             return ""
 
         parts = getattr(content, "parts", None) or []
-        out: list[str] = []
-        for p in parts:
-            t = getattr(p, "text", None)
-            if t:
-                out.append(t)
-        return "".join(out)
+        return "".join([t for p in parts if (t := getattr(p, "text", None))])
 
 
-    def _safe_raw(self, obj: Any) -> dict[str, Any]:
+    def _safe_raw(self, obj: Any, exclude: Any = None) -> dict[str, Any]:
         """
         Convert response to a safe JSON-like dict for debugging.
 
         Args:
             obj: Provider response object.
+            exclude: Optional pydantic exclude spec for fields not worth
+                copying (e.g. embedding values already returned as vectors).
 
         Returns:
             JSON-like dict.
@@ -299,10 +503,207 @@ class AsyncGeminiLLMClient(AsyncBaseLLMClient):
         dump = getattr(obj, "model_dump", None)
         if callable(dump):
             try:
-                raw = dump()
+                raw = dump(exclude=exclude) if exclude is not None else dump()
                 if isinstance(raw, dict):
                     return raw
             except Exception:
                 return {}
 
         return {"repr": repr(obj)}
+
+
+async def _batched(
+    stream: AsyncIterator[Any],
+    flush_s: float,
+    max_batch: int,
+) -> AsyncIterator[list[Any]]:
+    """
+    Group items of an async stream into lists.
+
+    A batch is yielded when it reaches the current target size or when
+    flush_s has passed since its first item. The target starts at 1 and
+    triples after each size-triggered flush, up to max_batch.
+
+    The pending __anext__ is awaited through asyncio.wait instead of
+    wait_for, so a flush timeout never cancels the underlying stream.
+
+    Args:
+        stream: Source async iterator.
+        flush_s: Max time an item waits in a batch (seconds).
+        max_batch: Max items per batch.
+
+    Yields:
+        Non-empty lists of items, in order.
+    """
+    loop = asyncio.get_running_loop()
+    it = stream.__aiter__()
+    target = 1
+    batch: list[Any] = []
+    deadline = 0.0
+    pending: asyncio.Future[Any] | None = None
+
+    try:
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(it.__anext__())
+
+            timeout = max(0.0, deadline - loop.time()) if batch else None
+            done, _ = await asyncio.wait((pending,), timeout=timeout)
+
+            if not done:
+                yield batch
+                batch = []
+                continue
+
+            task, pending = pending, None
+            try:
+                item = task.result()
+            except StopAsyncIteration:
+                break
+
+            if not batch:
+                deadline = loop.time() + flush_s
+            batch.append(item)
+
+            if len(batch) >= target:
+                yield batch
+                batch = []
+                target = min(target * 3, max_batch)
+
+        if batch:
+            yield batch
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
+class _BatchEmbedder:
+    """
+    Request coalescing for single-text embeddings.
+
+    submit() enqueues a text and waits on a future. A background task
+    drains the queue into batches of up to max_batch texts (or whatever
+    arrived within max_wait_ms of the first one), sends one request per
+    model and resolves each caller's future with its vector.
+
+    Args:
+        embed_fn: Async callable (model, texts) -> vectors.
+        max_batch: Max texts per provider request.
+        max_wait_ms: Max time the first text in a batch waits for others.
+    """
+
+    __slots__ = ("_embed_fn", "_max_batch", "_max_wait_s", "_queue", "_task", "_flushes")
+
+    def __init__(
+        self,
+        embed_fn: Callable[[str, list[str]], Awaitable[list[list[float]]]],
+        *,
+        max_batch: int = 64,
+        max_wait_ms: float = 10.0,
+    ) -> None:
+        self._embed_fn = embed_fn
+        self._max_batch = max_batch
+        self._max_wait_s = max_wait_ms / 1000
+        self._queue: asyncio.Queue[tuple[str, str, asyncio.Future[list[float]]]] | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._flushes: set[asyncio.Task[None]] = set()
+
+
+    async def submit(self, model: str, text: str) -> list[float]:
+        """
+        Queue a text and wait for its vector.
+
+        Args:
+            model: Embedding model.
+            text: Input text.
+
+        Returns:
+            The embedding vector.
+        """
+        # Started lazily: the client may be built outside a running loop.
+        if self._task is None or self._task.done():
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._run())
+
+        future: asyncio.Future[list[float]] = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((model, text, future))
+        return await future
+
+
+    async def aclose(self) -> None:
+        """
+        Stop the background task and fail any pending submissions.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+        if self._flushes:
+            await asyncio.gather(*self._flushes, return_exceptions=True)
+
+        while self._queue is not None and not self._queue.empty():
+            _, _, future = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(ProviderError(_PROVIDER, "client closed", is_retryable=False))
+
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self._max_wait_s
+
+            try:
+                while len(batch) < self._max_batch:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                # aclose() only fails what is still queued; texts already
+                # taken into this batch would otherwise wait forever.
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(
+                            ProviderError(_PROVIDER, "client closed", is_retryable=False)
+                        )
+                raise
+
+            by_model: dict[str, list[tuple[str, asyncio.Future[list[float]]]]] = {}
+            for model, text, future in batch:
+                by_model.setdefault(model, []).append((text, future))
+
+            # Flush in the background so the next batch can fill meanwhile.
+            for model, items in by_model.items():
+                task = asyncio.create_task(self._flush(model, items))
+                self._flushes.add(task)
+                task.add_done_callback(self._flushes.discard)
+
+
+    async def _flush(
+        self,
+        model: str,
+        items: list[tuple[str, asyncio.Future[list[float]]]],
+    ) -> None:
+        try:
+            vectors = await self._embed_fn(model, [text for text, _ in items])
+            if len(vectors) != len(items):
+                raise ProviderError(
+                    _PROVIDER,
+                    f"expected {len(items)} embeddings, got {len(vectors)}",
+                    is_retryable=True,
+                )
+        except Exception as e:
+            for _, future in items:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), vector in zip(items, vectors):
+            if not future.done():
+                future.set_result(vector)
@@ -0,0 +1,261 @@
+# ---------------------------------------------------------------------
+# Standard library
+# ---------------------------------------------------------------------
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Callable
+
+# ---------------------------------------------------------------------
+# Third-party libraries
+# ---------------------------------------------------------------------
+from google.genai.types import Content, GenerateContentConfig, Part
+
+# ---------------------------------------------------------------------
+# Internal application imports
+# ---------------------------------------------------------------------
+from llm_sdk.domain.chat import ChatMessage, ChatPart, ChatRequest
+from llm_sdk.exceptions import ProviderError, ValidationError
+
+
+# Provider name used in ProviderError and the plugin spec.
+_PROVIDER = "gemini"
+
+
+# SDK role -> Gemini role; roles not listed pass through unchanged.
+_ROLE_MAP: dict[str, str] = {"assistant": "model"}
+
+
+# Common file extensions -> MIME type. Looked up directly so Part.from_uri
+# doesn't fall back to mimetypes.guess_type() for every URI.
+_MIME_BY_EXT: dict[str, str] = {
+    "jpg": "image/jpeg",
+    "jpeg": "image/jpeg",
+    "png": "image/png",
+    "webp": "image/webp",
+    "gif": "image/gif",
+    "heic": "image/heic",
+    "heif": "image/heif",
+    "pdf": "application/pdf",
+    "txt": "text/plain",
+    "mp3": "audio/mpeg",
+    "wav": "audio/wav",
+    "mp4": "video/mp4",
+}
+
+
+# Catalog-style workloads send the same image URIs over and over.
+@lru_cache(maxsize=4096)
+def _mime_from_uri(uri: str) -> str | None:
+    """
+    Infer a MIME type from a URI's file extension (memoized per URI).
+
+    Args:
+        uri: File URI or URL (query string allowed).
+
+    Returns:
+        MIME type, or None if the extension is unknown.
+    """
+    path = uri.partition("?")[0]
+    _, dot, ext = path.rpartition(".")
+    if not dot or "/" in ext:
+        return None
+    return _MIME_BY_EXT.get(ext.lower())
+
+
+def _mime_from_bytes(data: bytes) -> str | None:
+    """
+    Detect common image formats from their magic bytes.
+
+    Args:
+        data: Image payload.
+
+    Returns:
+        MIME type, or None if the format is not recognised.
+    """
+    if data[:3] == b"\xff\xd8\xff":
+        return "image/jpeg"
+    if data[:8] == b"\x89PNG\r\n\x1a\n":
+        return "image/png"
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "image/webp"
+    if data[:6] in (b"GIF87a", b"GIF89a"):
+        return "image/gif"
+    return None
+
+
+def _text_part(part: ChatPart) -> Part:
+    return Part.from_text(text=part.text or "")
+
+
+def _uri_part(part: ChatPart) -> Part:
+    uri = (part.url or part.uri or "").strip()
+    if not uri:
+        raise ValidationError(f"{part.type} part requires 'url' or 'uri'")
+
+    mime_type = part.mime_type or _mime_from_uri(uri)
+    if mime_type is not None:
+        return Part.from_uri(file_uri=uri, mime_type=mime_type)
+
+    # Unlisted extension: let google-genai guess, which raises ValueError
+    # when it can't. Only that error is translated; anything else is a bug.
+    try:
+        return Part.from_uri(file_uri=uri)
+    except ValueError as e:
+        raise ValidationError(f"{part.type} part needs 'mime_type': {e}") from e
+
+
+def _bytes_part(part: ChatPart) -> Part:
+    data = part.data
+    if not data:
+        raise ValidationError("image_bytes part requires 'data'")
+
+    mime_type = part.mime_type or _mime_from_bytes(data)
+    if not mime_type:
+        raise ValidationError("image_bytes part requires 'mime_type' (e.g. image/png)")
+
+    # bytes pass through Blob validation without a copy; memoryview is
+    # rejected by it and bytearray is copied anyway, so convert those once.
+    if type(data) is not bytes:
+        data = bytes(data)
+
+    return Part.from_bytes(data=data, mime_type=mime_type)
+
+
+def _unsupported_part(part: ChatPart) -> Part:
+    raise ProviderError(_PROVIDER, f"unsupported part type: {part.type}", is_retryable=False)
+
+
+# Part types built from a URI (and therefore safe to share by URI).
+_URI_TYPES = frozenset({"image_url", "file_uri"})
+
+
+# Part builders keyed by ChatPart.type: one dict lookup per part instead
+# of an if/elif chain of string compares.
+_PART_BUILDERS: dict[str, Callable[[ChatPart], Part]] = {
+    "text": _text_part,
+    "image_url": _uri_part,
+    "file_uri": _uri_part,
+    "image_bytes": _bytes_part,
+}
+
+
+def to_gemini_parts(
+    parts: list[ChatPart],
+    uri_parts: dict[tuple[str | None, str | None], Part] | None = None,
+) -> list[Part]:
+    """
+    Convert SDK parts into Gemini Parts.
+
+    Args:
+        parts: Normalized parts of one message.
+        uri_parts: Optional memo of URI parts already built, keyed by
+            (url or uri, mime_type). Repeated URIs reuse the same Part
+            instead of being validated and built again.
+
+    Returns:
+        list[Part]
+
+    Raises:
+        ValidationError: If a part lacks its required fields.
+        ProviderError: If a part type is not supported.
+    """
+    get = _PART_BUILDERS.get
+    if uri_parts is None:
+        return [get(p.type, _unsupported_part)(p) for p in parts]
+
+    out: list[Part] = []
+    for p in parts:
+        if p.type not in _URI_TYPES:
+            out.append(get(p.type, _unsupported_part)(p))
+            continue
+
+        key = (p.url or p.uri, p.mime_type)
+        built = uri_parts.get(key)
+        if built is None:
+            built = uri_parts[key] = _uri_part(p)
+        out.append(built)
+
+    return out
+
+
+def _text_content(role: str, text: str) -> Content:
+    # Plain-text messages (no parts) skip the per-part dispatch.
+    return Content(role=_ROLE_MAP.get(role, role), parts=[Part.from_text(text=text)])
+
+
+def to_gemini_contents(messages: list[ChatMessage]) -> list[Content]:
+    """
+    Convert SDK messages into Gemini Contents.
+
+    Supports:
+    - text
+    - image_url (as URI)
+    - file_uri
+    - image_bytes
+
+    Plain-text messages (no parts) take a direct path. A URI repeated across
+    the conversation is converted once per request; sharing the Part is safe
+    because Gemini never mutates request Contents or Parts.
+
+    Args:
+        messages: List of ChatMessage from SDK domain.
+
+    Returns:
+        List of Gemini Content objects.
+    """
+    role_of = _ROLE_MAP.get
+    uri_parts: dict[tuple[str | None, str | None], Part] = {}
+    contents: list[Content] = []
+
+    for m in messages:
+        if not m.parts:
+            contents.append(_text_content(m.role, m.content))
+            continue
+
+        parts = to_gemini_parts(m.parts, uri_parts)
+        contents.append(Content(role=role_of(m.role, m.role), parts=parts))
+
+    return contents
+
+
+@lru_cache(maxsize=256)
+def _generation_config(
+    temperature: float,
+    max_output_tokens: int | None,
+    mime_type: str,
+) -> GenerateContentConfig:
+    return GenerateContentConfig(
+        temperature=temperature,
+        max_output_tokens=max_output_tokens,
+        response_mime_type=mime_type,
+    )
+
+
+def to_generation_config(request: ChatRequest) -> GenerateContentConfig:
+    """
+    Build the GenerateContentConfig for a chat request.
+
+    Schema-less configs are cached per (temperature, max tokens, MIME type),
+    so repeated settings skip google-genai's dict validation on every call;
+    google-genai copies the config before use, so sharing it is safe.
+    Requests with an output schema get a fresh config, because google-genai
+    edits the schema dict in place (e.g. adds property_ordering).
+
+    Args:
+        request: ChatRequest.
+
+    Returns:
+        GenerateContentConfig
+    """
+    if request.output_schema is None:
+        return _generation_config(
+            request.temperature, request.max_output_tokens, request.output_mime_type
+        )
+
+    return GenerateContentConfig(
+        temperature=request.temperature,
+        max_output_tokens=request.max_output_tokens,
+        response_mime_type=request.output_mime_type,
+        response_schema=request.output_schema,
+    )
@@ -0,0 +1,91 @@
+# ---------------------------------------------------------------------
+# Standard library
+# ---------------------------------------------------------------------
+from __future__ import annotations
+
+import threading
+from functools import lru_cache
+from typing import Any
+
+# ---------------------------------------------------------------------
+# Third-party libraries
+# ---------------------------------------------------------------------
+from google import genai
+from google.auth import default
+from google.genai.types import HttpOptions
+
+# ---------------------------------------------------------------------
+# Internal application imports
+# ---------------------------------------------------------------------
+from llm_sdk.http_client import HttpConfig, pool_limits, require_http2
+
+
+@lru_cache(maxsize=8)
+def get_credentials(scopes: tuple[str, ...] = ()) -> tuple[Any, str | None]:
+    """
+    Resolve Application Default Credentials once per scope set.
+
+    google.auth.default() reads files and may query the metadata server;
+    the returned credentials refresh their own tokens, so sharing them
+    across clients is safe.
+
+    Args:
+        scopes: OAuth scopes (empty for the defaults).
+
+    Returns:
+        (credentials, project_id)
+    """
+    return default(scopes=list(scopes) or None)
+
+
+_clients: dict[tuple[tuple[str, ...], str, HttpConfig], genai.Client] = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(
+    scopes: tuple[str, ...],
+    location: str,
+    http: HttpConfig | None = None,
+) -> genai.Client:
+    """
+    Get the process-wide Vertex AI genai.Client for (scopes, location, http).
+
+    The client owns its HTTP connection pool, so reusing it keeps
+    connections warm across SyncGeminiClient instances. The pool is sized
+    by http (keep-alive, limits, optional HTTP/2) rather than httpx
+    defaults.
+
+    Args:
+        scopes: OAuth scopes (empty for the defaults).
+        location: Vertex AI location.
+        http: Connection pool configuration. Defaults to HttpConfig().
+
+    Returns:
+        genai.Client
+
+    Raises:
+        ImportError: If http2 is enabled but the h2 package is missing.
+    """
+    http = http or HttpConfig()
+    key = (scopes, location, http)
+    client = _clients.get(key)
+    if client is not None:
+        return client
+
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            require_http2(http)
+            credentials, project = get_credentials(scopes)
+            client = genai.Client(
+                vertexai=True,
+                project=project,
+                location=location,
+                credentials=credentials,
+                http_options=HttpOptions(
+                    client_args={"limits": pool_limits(http), "http2": http.http2},
+                ),
+            )
+            _clients[key] = client
+
+    return client
@@ -0,0 +1,62 @@
+# ---------------------------------------------------------------------
+# Standard library
+# ---------------------------------------------------------------------
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+
+
+class EmbeddingCache:
+    """
+    LRU cache of embedding vectors keyed by (model, sha1(text)).
+
+    Hashing keeps long texts out of the keys. A lock guards each operation
+    so the sync client can share one cache across embed_many() threads; on
+    the async client it is never contended.
+
+    Args:
+        maxsize: Max cached vectors; 0 disables the cache.
+    """
+
+    __slots__ = ("_maxsize", "_data", "_lock")
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._data: OrderedDict[tuple[str, bytes], list[float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+
+    @staticmethod
+    def _key(model: str, text: str) -> tuple[str, bytes]:
+        return model, hashlib.sha1(text.encode("utf-8")).digest()
+
+
+    def get(self, model: str, text: str) -> list[float] | None:
+        if not self._maxsize:
+            return None
+
+        key = self._key(model, text)
+        with self._lock:
+            vector = self._data.get(key)
+            if vector is None:
+                return None
+            self._data.move_to_end(key)
+
+        # Copy so callers can't mutate the cached vector.
+        return list(vector)
+
+
+    def put(self, model: str, text: str, vector: list[float]) -> None:
+        if not self._maxsize:
+            return
+
+        key = self._key(model, text)
+        vector = list(vector)
+        with self._lock:
+            self._data[key] = vector
+            self._data.move_to_end(key)
+
+            if len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
@@ -6,17 +6,22 @@ from __future__ import annotations
 # ---------------------------------------------------------------------
 # Third-party libraries
 # ---------------------------------------------------------------------
+import httpx
 
 # ---------------------------------------------------------------------
 # Internal application imports
 # ---------------------------------------------------------------------
 from llm_sdk.providers.async_base import AsyncBaseLLMClient
 from llm_sdk.providers.async_registry import ProviderSpec
+from llm_sdk.providers.sync_base import BaseLLMClient
 
 from llm_sdk.settings import SDKSettings
 from llm_sdk.timeouts import TimeoutConfig
 
 from llm_sdk_provider_gemini.async_client import AsyncGeminiLLMClient
+from llm_sdk_provider_gemini.contents import _PROVIDER
+from llm_sdk_provider_gemini.semantic_cache import SemanticCache
+from llm_sdk_provider_gemini.sync_client import GeminiLLMClient
 
 
 class GeminiProviderFactory():
@@ -29,7 +34,7 @@ class GeminiProviderFactory():
 
     def spec(self) -> ProviderSpec:
         return ProviderSpec(
-            name="gemini",
+            name=_PROVIDER,
             supports_chat=True,
             supports_embeddings=True,
             supports_streaming=True,
@@ -37,20 +42,72 @@ class GeminiProviderFactory():
         )
 
 
-    def create(self, settings: SDKSettings) -> AsyncBaseLLMClient:
+    def create(
+        self,
+        settings: SDKSettings,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> AsyncBaseLLMClient:
         """
         Create an AsyncGeminiLLMClient using SDK settings.
 
         Args:
             settings: SDKSettings resolved by Pydantic Settings.
+            http_client: Optional shared AsyncClient owned by the SDK.
 
         Returns:
             AsyncBaseLLMClient instance.
         """
         timeouts = TimeoutConfig()
+        gemini = settings.gemini
+
+        semantic_cache = None
+        if gemini.semantic_cache_threshold is not None:
+            semantic_cache = SemanticCache(
+                threshold=gemini.semantic_cache_threshold,
+                max_entries=gemini.semantic_cache_size,
+                ttl_s=gemini.semantic_cache_ttl_s,
+                quantize=gemini.semantic_cache_int8,
+            )
 
         return AsyncGeminiLLMClient(
-            location=settings.gemini.location,
-            scope=settings.gemini.scopes,
+            location=gemini.location,
+            scope=gemini.scopes,
             timeouts=timeouts,
+            http_client=http_client,
+            embedding_cache_size=gemini.embedding_cache_size,
+            embedding_batch_size=gemini.embedding_batch_size,
+            response_cache_size=gemini.response_cache_size,
+            semantic_cache=semantic_cache,
+            semantic_cache_model=gemini.semantic_cache_model,
+            stream_flush_ms=gemini.stream_flush_ms,
+            stream_max_batch=gemini.stream_max_batch,
+            max_concurrent_requests=gemini.max_concurrent_requests,
+        )
+
+
+    def create_sync(self, settings: SDKSettings) -> BaseLLMClient:
+        """
+        Create a sync GeminiLLMClient using SDK settings.
+
+        Sync providers are registered by hand (ProviderSpec.factory), so this
+        is meant to be wrapped in that factory.
+
+        Args:
+            settings: SDKSettings resolved by Pydantic Settings.
+
+        Returns:
+            BaseLLMClient instance.
+        """
+        gemini = settings.gemini
+
+        return GeminiLLMClient(
+            location=gemini.location,
+            scope=gemini.scopes,
+            timeouts=settings.timeouts,
+            http=settings.http,
+            embedding_batch_size=gemini.embedding_batch_size,
+            embedding_cache_size=gemini.embedding_cache_size,
+            response_cache_size=gemini.response_cache_size,
+            stream_flush_ms=gemini.stream_flush_ms,
+            stream_max_batch=gemini.sync_stream_max_batch,
         )
@@ -0,0 +1,95 @@
+# ---------------------------------------------------------------------
+# Standard library
+# ---------------------------------------------------------------------
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+# ---------------------------------------------------------------------
+# Internal application imports
+# ---------------------------------------------------------------------
+from llm_sdk.domain.chat import ChatRequest, ChatResponse
+
+
+def request_key(request: ChatRequest) -> bytes:
+    """
+    Hash everything in a chat request that changes the answer.
+
+    Covers the model, sampling and output settings, and every message part
+    (text, URIs, and a digest of inline bytes).
+
+    Args:
+        request: ChatRequest.
+
+    Returns:
+        16-byte blake2b digest.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    schema = json.dumps(request.output_schema, sort_keys=True) if request.output_schema else ""
+    h.update(
+        repr((
+            request.model,
+            request.temperature,
+            request.max_output_tokens,
+            request.output_mime_type,
+            schema,
+        )).encode("utf-8")
+    )
+
+    for msg in request.messages:
+        for part in msg.normalized_parts():
+            data = hashlib.blake2b(part.data, digest_size=16).hexdigest() if part.data else None
+            h.update(
+                repr((msg.role, part.type, part.text, part.url, part.uri, part.mime_type, data))
+                .encode("utf-8")
+            )
+
+    return h.digest()
+
+
+class ResponseCache:
+    """
+    LRU cache of chat responses keyed by request_key().
+
+    Only identical requests hit, so it suits deterministic workloads
+    (temperature 0, repeated prompts); for near-duplicates see
+    SemanticCache. A lock guards each operation, as in EmbeddingCache.
+
+    Args:
+        maxsize: Max cached responses; 0 disables the cache.
+    """
+
+    __slots__ = ("_maxsize", "_data", "_lock")
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._data: OrderedDict[bytes, ChatResponse] = OrderedDict()
+        self._lock = threading.Lock()
+
+
+    @property
+    def enabled(self) -> bool:
+        return self._maxsize > 0
+
+
+    def get(self, key: bytes) -> ChatResponse | None:
+        with self._lock:
+            response = self._data.get(key)
+            if response is not None:
+                self._data.move_to_end(key)
+            return response
+
+
+    def put(self, key: bytes, response: ChatResponse) -> None:
+        if not self._maxsize:
+            return
+
+        with self._lock:
+            self._data[key] = response
+            self._data.move_to_end(key)
+
+            if len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
@@ -0,0 +1,196 @@
+# ---------------------------------------------------------------------
+# Standard library
+# ---------------------------------------------------------------------
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Hashable
+
+# ---------------------------------------------------------------------
+# Internal application imports
+# ---------------------------------------------------------------------
+from llm_sdk.domain.chat import ChatResponse
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+@dataclass(slots=True)
+class _Namespace:
+    """
+    Cached entries for one (model, output settings) namespace.
+
+    Args:
+        vectors: L2-normalized prompt embeddings, shape (n, dim); float32,
+            or int8 when the cache quantizes.
+        scales: Per-row dequantization scale (int8 only), shape (n,).
+        responses: Cached responses, aligned with vectors.
+        expires_at: Monotonic expiry time per entry.
+    """
+
+    vectors: "np.ndarray"
+    scales: "np.ndarray | None" = None
+    responses: list[ChatResponse] = field(default_factory=list)
+    expires_at: list[float] = field(default_factory=list)
+
+
+class SemanticCache:
+    """
+    Nearest-neighbour cache of chat responses keyed by prompt embedding.
+
+    A lookup returns the stored response whose prompt embedding has the
+    highest cosine similarity to the query, if that similarity is at least
+    threshold. Entries expire after ttl_s; each namespace keeps at most
+    max_entries (oldest evicted first).
+
+    With quantize=True, vectors are stored as int8 with one float32 scale
+    per row: 4x less memory, with cosine scores off by well under 1%.
+
+    Requires numpy: pip install "llm-sdk-core[numpy]".
+
+    Args:
+        threshold: Minimum cosine similarity for a hit (0..1).
+        max_entries: Max entries per namespace.
+        ttl_s: Entry lifetime (seconds).
+        quantize: Store vectors as int8 instead of float32.
+    """
+
+    __slots__ = ("_np", "_threshold", "_max_entries", "_ttl_s", "_quantize", "_namespaces")
+
+    # Rows dequantized per matmul block, bounding the temporary float32 copy.
+    _BLOCK_ROWS = 1024
+
+    def __init__(
+        self,
+        *,
+        threshold: float,
+        max_entries: int = 1000,
+        ttl_s: float = 3600.0,
+        quantize: bool = False,
+    ) -> None:
+        try:
+            import numpy as np
+        except ImportError as e:
+            raise ImportError(
+                'SemanticCache requires numpy: pip install "llm-sdk-core[numpy]"'
+            ) from e
+
+        self._np = np
+        self._threshold = threshold
+        self._max_entries = max_entries
+        self._ttl_s = ttl_s
+        self._quantize = quantize
+        self._namespaces: dict[Hashable, _Namespace] = {}
+
+
+    def lookup(self, namespace: Hashable, vector: list[float]) -> ChatResponse | None:
+        """
+        Find a cached response for a semantically similar prompt.
+
+        Args:
+            namespace: Cache namespace (e.g. model + output settings).
+            vector: Prompt embedding.
+
+        Returns:
+            ChatResponse | None
+        """
+        ns = self._namespaces.get(namespace)
+        if ns is None or not ns.responses:
+            return None
+
+        self._expire(ns)
+        if not ns.responses:
+            return None
+
+        scores = self._scores(ns, self._normalize(vector))
+        best = int(scores.argmax())
+
+        if scores[best] < self._threshold:
+            return None
+
+        return ns.responses[best]
+
+
+    def store(self, namespace: Hashable, vector: list[float], response: ChatResponse) -> None:
+        """
+        Cache a response under its prompt embedding.
+
+        Args:
+            namespace: Cache namespace.
+            vector: Prompt embedding.
+            response: Response to cache.
+        """
+        np = self._np
+        row = self._normalize(vector)
+
+        scale = None
+        if self._quantize:
+            row, scale = self._quantize_row(row)
+
+        ns = self._namespaces.get(namespace)
+
+        if ns is None or ns.vectors.shape[1] != row.shape[0]:
+            ns = _Namespace(vectors=row[None, :])
+            if scale is not None:
+                ns.scales = np.array([scale], dtype=np.float32)
+            self._namespaces[namespace] = ns
+        else:
+            ns.vectors = np.vstack((ns.vectors, row))
+            if scale is not None:
+                ns.scales = np.append(ns.scales, np.float32(scale))
+
+        ns.responses.append(response)
+        ns.expires_at.append(time.monotonic() + self._ttl_s)
+
+        overflow = len(ns.responses) - self._max_entries
+        if overflow > 0:
+            self._drop(ns, overflow)
+
+
+    def _scores(self, ns: _Namespace, query: "np.ndarray") -> "np.ndarray":
+        # float32: one matrix-vector product scores every cached prompt.
+        if ns.scales is None:
+            return ns.vectors @ query
+
+        np = self._np
+        scores = np.empty(len(ns.vectors), dtype=np.float32)
+        for start in range(0, len(ns.vectors), self._BLOCK_ROWS):
+            block = ns.vectors[start:start + self._BLOCK_ROWS]
+            scores[start:start + len(block)] = block.astype(np.float32) @ query
+
+        return scores * ns.scales
+
+
+    def _quantize_row(self, row: "np.ndarray") -> tuple["np.ndarray", float]:
+        np = self._np
+        peak = float(np.abs(row).max()) if row.size else 0.0
+        scale = peak / 127 if peak else 1.0
+        return np.clip(np.round(row / scale), -127, 127).astype(np.int8), scale
+
+
+    def _normalize(self, vector: list[float]) -> "np.ndarray":
+        v = self._np.asarray(vector, dtype=self._np.float32)
+        norm = self._np.linalg.norm(v)
+        return v / norm if norm else v
+
+
+    def _expire(self, ns: _Namespace) -> None:
+        # Entries are appended in time order, so expired ones form a prefix.
+        now = time.monotonic()
+        expired = 0
+        for t in ns.expires_at:
+            if t > now:
+                break
+            expired += 1
+
+        if expired:
+            self._drop(ns, expired)
+
+
+    def _drop(self, ns: _Namespace, count: int) -> None:
+        ns.vectors = ns.vectors[count:]
+        if ns.scales is not None:
+            ns.scales = ns.scales[count:]
+        del ns.responses[:count]
+        del ns.expires_at[:count]
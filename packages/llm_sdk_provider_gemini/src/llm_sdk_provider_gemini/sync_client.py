@@ -3,15 +3,13 @@
 # ---------------------------------------------------------------------
 from __future__ import annotations
 
+import time
 from typing import Any, Iterator
-from llm_sdk.exceptions import ValidationError
 
 # ---------------------------------------------------------------------
 # Third-party libraries
 # ---------------------------------------------------------------------
-from google import genai
-from google.auth import default
-from google.genai.types import Content, Part, GenerateContentConfig
+from google.genai.types import Content
 
 # ---------------------------------------------------------------------
 # Internal application imports
@@ -20,10 +18,30 @@ from llm_sdk.domain.chat import ChatMessage, ChatRequest, ChatResponse, ChatStre
 from llm_sdk.domain.embeddings import EmbeddingRequest, EmbeddingResponse
 from llm_sdk.exceptions import ProviderError
 from llm_sdk.providers.sync_base import BaseLLMClient
+from llm_sdk.http_client import HttpConfig
 from llm_sdk.timeouts import TimeoutConfig
 
 from llm_sdk.utils.message_utils import extract_token_usage
 
+from llm_sdk_provider_gemini.contents import _PROVIDER, to_gemini_contents, to_generation_config
+from llm_sdk_provider_gemini.credentials import get_client, get_credentials
+from llm_sdk_provider_gemini.embedding_cache import EmbeddingCache
+from llm_sdk_provider_gemini.response_cache import ResponseCache, request_key
+
+
+# Embedding values are returned as EmbeddingResponse.vectors; copying them
+# into raw as well would double the cost of every embed call.
+_EMBED_RAW_EXCLUDE = {"embeddings": {"__all__": {"values"}}}
+
+
+def _embedding_values(e: Any) -> list[float]:
+    values = getattr(e, "values", None)
+    if values is None:
+        values = getattr(e, "embedding", None)
+    # google-genai already hands back list[float]; only copy other
+    # sequence types.
+    return values if type(values) is list else list(values or [])
+
 
 class GeminiLLMClient(BaseLLMClient):
     """
@@ -41,42 +59,61 @@ class GeminiLLMClient(BaseLLMClient):
         location: str,
         scope: list[str] | None = None,
         timeouts: TimeoutConfig | None = None,
+        http: HttpConfig | None = None,
+        embedding_batch_size: int = 100,
+        embedding_cache_size: int = 10_000,
+        response_cache_size: int = 0,
+        stream_flush_ms: float = 50.0,
+        stream_max_batch: int = 1,
     ) -> None:
-        self._credentials, self._project = default(scopes=scope)
+        scopes = tuple(scope or ())
+
+        # Credentials and the genai.Client are shared process-wide, so
+        # building a client per request doesn't redo auth or the pool.
+        self._credentials, self._project = get_credentials(scopes)
         self._location = location
         self._timeouts = timeouts
 
         if not self._timeouts:
             self._timeouts = TimeoutConfig()
 
-        self._client = genai.Client(
-            vertexai=True,
-            project=self._project,
-            location=self._location,
-            credentials=self._credentials,
-        )
+        self._client = get_client(scopes, location, http)
+        self._embed_batch_size = embedding_batch_size
+
+        # Vectors of recently embedded texts; 0 disables caching.
+        self._emb_cache = EmbeddingCache(embedding_cache_size)
+
+        # Responses to identical requests; 0 disables caching.
+        self._response_cache = ResponseCache(response_cache_size)
+
+        # Stream chunks can be merged into one event per flush window; off
+        # by default since a merged chunk waits for the next one (_batched).
+        self._stream_flush_s = stream_flush_ms / 1000
+        self._stream_max_batch = stream_max_batch
 
     @property
     def provider_name(self) -> str:
-        return "gemini"
+        return _PROVIDER
 
 
     def chat(self, request: ChatRequest) -> ChatResponse:
+        exact_key = request_key(request) if self._response_cache.enabled else None
+
+        if exact_key is not None:
+            hit = self._response_cache.get(exact_key)
+            if hit is not None:
+                return hit
+
         contents = self._to_gemini_contents(request.messages)
 
         try:
             resp = self._client.models.generate_content(
                 model=request.model,
                 contents=contents,
-                config={
-                    "temperature": request.temperature,
-                    "max_output_tokens": request.max_output_tokens,
-                    "response_schema": request.output_schema,
-                    "response_mime_type": request.output_mime_type,
-                },
+                config=to_generation_config(request),
             )
         except Exception as e:
-            raise ProviderError("gemini", f"provider error: {e}", is_retryable=True) from e
+            raise ProviderError(_PROVIDER, f"provider error: {e}", is_retryable=True) from e
 
         text = getattr(resp, "text", None)
 
@@ -86,7 +123,12 @@ class GeminiLLMClient(BaseLLMClient):
         usage = extract_token_usage(resp)
 
         raw = self._safe_raw(resp)
-        return ChatResponse(model=request.model, content=text or "", usage=usage, raw=raw)
+        response = ChatResponse(model=request.model, content=text or "", usage=usage, raw=raw)
+
+        if exact_key is not None:
+            self._response_cache.put(exact_key, response)
+
+        return response
 
 
     def stream_chat(self, request: ChatRequest) -> Iterator[ChatStreamEvent]:
@@ -96,116 +138,115 @@ class GeminiLLMClient(BaseLLMClient):
             stream = self._client.models.generate_content_stream(
                 model=request.model,
                 contents=contents,
-                config={
-                    "temperature": request.temperature,
-                    "max_output_tokens": request.max_output_tokens,
-                    "response_schema": request.output_schema,
-                    "response_mime_type": request.output_mime_type,
-                },
+                config=to_generation_config(request),
             )
         except Exception as e:
-            raise ProviderError("gemini", f"provider error: {e}", is_retryable=True) from e
+            raise ProviderError(_PROVIDER, f"provider error: {e}", is_retryable=True) from e
 
         last_usage = None
 
         try:
-            for chunk in stream:
-                usage = extract_token_usage(chunk) or last_usage
-                if usage is not None:
-                    last_usage = usage
+            for chunks in _batched(stream, self._stream_flush_s, self._stream_max_batch):
+                deltas: list[str] = []
+
+                for chunk in chunks:
+                    usage = extract_token_usage(chunk)
+                    if usage is not None:
+                        last_usage = usage
 
-                delta = getattr(chunk, "text", None)
+                    delta = getattr(chunk, "text", None)
+                    if delta:
+                        deltas.append(delta)
 
-                if delta:
-                    yield ChatStreamEvent(delta=delta, done=False, usage=usage)
+                if deltas:
+                    yield ChatStreamEvent(delta="".join(deltas), done=False, usage=last_usage)
 
             yield ChatStreamEvent(delta="", done=True, usage=last_usage)
 
         except Exception as e:
-            raise ProviderError("gemini", f"stream error: {e}", is_retryable=True) from e
+            raise ProviderError(_PROVIDER, f"stream error: {e}", is_retryable=True) from e
 
 
 
     def embed(self, request: EmbeddingRequest) -> EmbeddingResponse:
-        try:
-            resp = self._client.models.embed_content(
-                model=request.model,
-                contents=request.input,
+        model = request.model
+        texts = request.input
+
+        # Texts embedded recently with the same model come from the cache;
+        # only the misses are sent to the provider.
+        cache = self._emb_cache
+        vectors: list[list[float] | None] = [cache.get(model, t) for t in texts]
+        missing = [i for i, v in enumerate(vectors) if v is None]
+
+        if not missing:
+            return EmbeddingResponse(model=model, vectors=vectors, raw={})
+
+        # Texts repeated within the call are sent once.
+        slots: dict[str, int] = {}
+        order = [slots.setdefault(texts[i], len(slots)) for i in missing]
+        pending = list(slots)
+        size = self._embed_batch_size
+
+        # Misses above the per-call limit go out in consecutive batches.
+        fresh: list[list[float]] = []
+        raws: list[dict[str, Any]] = []
+        for j in range(0, len(pending), size):
+            resp = self._embed_content(model, pending[j:j + size])
+            fresh.extend(self._extract_embeddings(resp))
+            raws.append(self._safe_raw(resp, _EMBED_RAW_EXCLUDE))
+
+        if len(fresh) != len(pending):
+            raise ProviderError(
+                _PROVIDER,
+                f"expected {len(pending)} embeddings, got {len(fresh)}",
+                is_retryable=True,
             )
-        except Exception as e:
-            raise ProviderError("gemini", f"provider error: {e}", is_retryable=True) from e
 
-        vectors = self._extract_embeddings(resp)
-        raw = self._safe_raw(resp)
+        for text, vector in zip(pending, fresh):
+            cache.put(model, text, vector)
 
-        return EmbeddingResponse(model=request.model, vectors=vectors, raw=raw)
+        # Repeats get their own copy, so mutating one vector never changes
+        # another position.
+        used = [False] * len(fresh)
+        for i, j in zip(missing, order):
+            vectors[i] = list(fresh[j]) if used[j] else fresh[j]
+            used[j] = True
+
+        raw = raws[0] if len(raws) == 1 else {"batches": raws}
+        return EmbeddingResponse(model=model, vectors=vectors, raw=raw)
 
     # -------------------------
     # Helpers
     # -------------------------
 
+    def _embed_content(self, model: str, texts: list[str]) -> Any:
+        """
+        Call embed_content, mapping failures to ProviderError.
+
+        Args:
+            model: Embedding model.
+            texts: Input texts.
+
+        Returns:
+            Provider response.
+        """
+        try:
+            return self._client.models.embed_content(model=model, contents=texts)
+        except Exception as e:
+            raise ProviderError(_PROVIDER, f"provider error: {e}", is_retryable=True) from e
+
+
     def _to_gemini_contents(self, messages: list[ChatMessage]) -> list[Content]:
         """
         Convert SDK messages into Gemini Contents.
 
-        Supports:
-        - text
-        - image_url (as URI)
-        - file_uri
-        - image_bytes
+        Args:
+            messages: List of ChatMessage from SDK domain.
+
+        Returns:
+            List of Gemini Content objects.
         """
-        contents: list[Content] = []
-
-        for msg in messages:
-            role = msg.role
-            if role == "assistant":
-                role = "model"
-
-            parts_out: list[Part] = []
-
-            for part in msg.normalized_parts():
-                if part.type == "text":
-                    parts_out.append(Part.from_text(text=part.text or ""))
-                    continue
-
-                elif part.type == "image_url":
-                    uri = (part.url or part.uri or "").strip()
-                    if not uri:
-                        raise ValidationError("image_url part requires 'url' or 'uri'")
-                    parts_out.append(Part.from_uri(file_uri=uri))
-                    continue
-
-                elif part.type == "file_uri":
-                    uri = (part.uri or "").strip()
-                    if not uri:
-                        raise ValidationError("file_uri part requires 'uri'")
-                    parts_out.append(Part.from_uri(file_uri=uri))
-                    continue
-
-                elif part.type == "image_bytes":
-                    if not part.mime_type:
-                        raise ValidationError(
-                            "gemini",
-                            "image_bytes requires mime_type (e.g. image/png)",
-                            is_retryable=False,
-                        )
-                    if not part.data:
-                        raise ProviderError("gemini", "image_bytes requires data", is_retryable=False)
-
-                    parts_out.append(
-                        Part.from_bytes(
-                            data=part.data,
-                            mime_type=part.mime_type,
-                        )
-                    )
-                    continue
-
-                else:
-                    raise ProviderError("gemini", f"unsupported part type: {part.type}", is_retryable=False)
-
-            contents.append(Content(role=role, parts=parts_out))
-
-        return contents
+        return to_gemini_contents(messages)
 
 
     def _extract_embeddings(self, resp: Any) -> list[list[float]]:
@@ -217,18 +258,12 @@ class GeminiLLMClient(BaseLLMClient):
         """
         embeddings = getattr(resp, "embeddings", None)
         if embeddings:
-            out: list[list[float]] = []
-            for e in embeddings:
-                values = getattr(e, "values", None)
-                if values is None:
-                    values = getattr(e, "embedding", None)
-                out.append(list(values or []))
-            return out
+            return [_embedding_values(e) for e in embeddings]
 
         # Fallback: single embedding
         values = getattr(resp, "values", None)
         if values:
-            return [list(values)]
+            return [values if type(values) is list else list(values)]
 
         return []
 
@@ -247,22 +282,20 @@ class GeminiLLMClient(BaseLLMClient):
             return ""
 
         parts = getattr(content, "parts", None) or []
-        out: list[str] = []
-        for p in parts:
-            t = getattr(p, "text", None)
-            if t:
-                out.append(t)
-        return "".join(out)
+        return "".join([t for p in parts if (t := getattr(p, "text", None))])
 
 
-    def _safe_raw(self, obj: Any) -> dict[str, Any]:
+    def _safe_raw(self, obj: Any, exclude: Any = None) -> dict[str, Any]:
         """
         Convert response to a safe JSON-like dict for debugging.
+
+        exclude is an optional pydantic exclude spec for fields not worth
+        copying (e.g. embedding values already returned as vectors).
         """
         dump = getattr(obj, "model_dump", None)
         if callable(dump):
             try:
-                raw = dump()
+                raw = dump(exclude=exclude) if exclude is not None else dump()
                 if isinstance(raw, dict):
                     return raw
             except Exception:
@@ -270,3 +303,44 @@ class GeminiLLMClient(BaseLLMClient):
 
         # fallback: repr
         return {"repr": repr(obj)}
+
+
+def _batched(stream: Iterator[Any], flush_s: float, max_batch: int) -> Iterator[list[Any]]:
+    """
+    Group items of a stream into lists.
+
+    Mirrors the async client's batching: the target size starts at 1 and
+    triples after each size-triggered flush, up to max_batch. A blocking
+    iterator can't be interrupted by a timer, so the flush_s window is
+    checked as each item arrives and a buffered item waits for the next
+    one, however long that takes. The client therefore defaults to
+    max_batch=1, which yields every item as soon as it arrives.
+
+    Args:
+        stream: Source iterator.
+        flush_s: Max time an item waits in a batch (seconds).
+        max_batch: Max items per batch.
+
+    Yields:
+        Non-empty lists of items, in order.
+    """
+    target = 1
+    batch: list[Any] = []
+    deadline = 0.0
+
+    for item in stream:
+        now = time.monotonic()
+        if not batch:
+            deadline = now + flush_s
+        batch.append(item)
+
+        if len(batch) >= target:
+            yield batch
+            batch = []
+            target = min(target * 3, max_batch)
+        elif now >= deadline:
+            yield batch
+            batch = []
+
+    if batch:
+        yield batch
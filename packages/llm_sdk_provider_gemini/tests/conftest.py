@@ -0,0 +1,35 @@
+# ---------------------------------------------------------------------
+# Third-party libraries
+# ---------------------------------------------------------------------
+import pytest
+from google.auth.credentials import AnonymousCredentials
+
+# ---------------------------------------------------------------------
+# Internal application imports
+# ---------------------------------------------------------------------
+from llm_sdk.settings import reset_settings
+
+import llm_sdk_provider_gemini.async_client as async_client
+import llm_sdk_provider_gemini.credentials as credentials
+import llm_sdk_provider_gemini.sync_client as sync_client
+
+
+@pytest.fixture(autouse=True)
+def fake_credentials(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Replace Application Default Credentials so clients build offline.
+    """
+    def _get_credentials(scopes=()):
+        return AnonymousCredentials(), "test-project"
+
+    monkeypatch.setattr(credentials, "get_credentials", _get_credentials)
+    monkeypatch.setattr(async_client, "get_credentials", _get_credentials)
+    monkeypatch.setattr(sync_client, "get_credentials", _get_credentials)
+    monkeypatch.setattr(credentials, "_clients", {})
+
+
+@pytest.fixture(autouse=True)
+def fresh_settings():
+    reset_settings()
+    yield
+    reset_settings()
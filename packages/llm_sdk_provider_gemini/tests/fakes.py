@@ -0,0 +1,106 @@
+# ---------------------------------------------------------------------
+# Standard library
+# ---------------------------------------------------------------------
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+# ---------------------------------------------------------------------
+# Internal application imports
+# ---------------------------------------------------------------------
+from llm_sdk.timeouts import TimeoutConfig
+
+from llm_sdk_provider_gemini.async_client import AsyncGeminiLLMClient
+from llm_sdk_provider_gemini.sync_client import GeminiLLMClient
+
+
+def embed_response(texts: list[str]) -> SimpleNamespace:
+    """
+    Fake embed_content response: one 1-d vector per text, len(text).
+    """
+    return SimpleNamespace(
+        embeddings=[SimpleNamespace(values=[float(len(t))]) for t in texts],
+        model_dump=lambda **kw: {"n": len(texts)},
+    )
+
+
+def chat_response(text: str) -> SimpleNamespace:
+    return SimpleNamespace(text=text, usage_metadata=None, model_dump=lambda **kw: {})
+
+
+class FakeModels:
+    """
+    Records calls to the google-genai `models` surface (sync flavour).
+
+    Args:
+        replies: Texts returned by successive generate_content calls.
+        stream: Chunks yielded by generate_content_stream.
+        embed_error: Raised by embed_content when set.
+    """
+
+    def __init__(
+        self,
+        replies: list[str] | None = None,
+        stream: list[Any] | None = None,
+        embed_error: Exception | None = None,
+    ) -> None:
+        self.replies = list(replies or ["ok"])
+        self.stream = list(stream or [])
+        self.embed_error = embed_error
+        self.embed_calls: list[list[str]] = []
+        self.generate_calls = 0
+
+
+    def embed_content(self, *, model: str, contents: list[str]) -> Any:
+        if self.embed_error is not None:
+            raise self.embed_error
+        self.embed_calls.append(list(contents))
+        return embed_response(contents)
+
+
+    def generate_content(self, *, model: str, contents: Any, config: Any) -> Any:
+        self.generate_calls += 1
+        return chat_response(self.replies[min(self.generate_calls, len(self.replies)) - 1])
+
+
+    def generate_content_stream(self, *, model: str, contents: Any, config: Any) -> Any:
+        return iter(self.stream)
+
+
+class FakeAsyncModels(FakeModels):
+    """
+    Async flavour of FakeModels (client.aio.models).
+    """
+
+    async def embed_content(self, *, model: str, contents: list[str]) -> Any:
+        return FakeModels.embed_content(self, model=model, contents=contents)
+
+
+    async def generate_content(self, *, model: str, contents: Any, config: Any) -> Any:
+        return FakeModels.generate_content(self, model=model, contents=contents, config=config)
+
+
+    async def generate_content_stream(self, *, model: str, contents: Any, config: Any) -> Any:
+        async def _gen():
+            for chunk in self.stream:
+                yield chunk
+        return _gen()
+
+
+def async_client(models: FakeAsyncModels, **kwargs: Any) -> AsyncGeminiLLMClient:
+    """
+    Build an AsyncGeminiLLMClient whose provider calls go to models.
+    """
+    client = AsyncGeminiLLMClient(location="us-central1", timeouts=TimeoutConfig(), **kwargs)
+    client._aio = SimpleNamespace(models=models)
+    return client
+
+
+def sync_client(models: FakeModels, **kwargs: Any) -> GeminiLLMClient:
+    """
+    Build a GeminiLLMClient whose provider calls go to models.
+    """
+    client = GeminiLLMClient(location="us-central1", **kwargs)
+    client._client = SimpleNamespace(models=models)
+    return client
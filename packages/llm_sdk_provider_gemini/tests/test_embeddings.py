@@ -0,0 +1,229 @@
+# ---------------------------------------------------------------------
+# Standard library
+# ---------------------------------------------------------------------
+import asyncio
+
+# ---------------------------------------------------------------------
+# Internal application imports
+# ---------------------------------------------------------------------
+from llm_sdk.domain.embeddings import EmbeddingRequest
+from llm_sdk.exceptions import ProviderError
+
+from llm_sdk_provider_gemini.async_client import _BatchEmbedder
+from llm_sdk_provider_gemini.embedding_cache import EmbeddingCache
+
+from fakes import FakeAsyncModels, FakeModels, async_client, sync_client
+
+
+def _request(*texts: str) -> EmbeddingRequest:
+    return EmbeddingRequest(model="emb", input=list(texts))
+
+
+def _embed_async(client, request: EmbeddingRequest):
+    async def run():
+        try:
+            return await client.embed(request)
+        finally:
+            await client.aclose()
+
+    return asyncio.run(run())
+
+
+# -------------------------
+# EmbeddingCache
+# -------------------------
+
+def test_cache_hit_returns_a_copy():
+    cache = EmbeddingCache(maxsize=2)
+    vector = [1.0, 2.0]
+    cache.put("emb", "a", vector)
+
+    vector.append(3.0)
+    hit = cache.get("emb", "a")
+    assert hit == [1.0, 2.0]
+
+    hit.append(4.0)
+    assert cache.get("emb", "a") == [1.0, 2.0]
+
+
+def test_cache_is_keyed_by_model_and_evicts_least_recently_used():
+    cache = EmbeddingCache(maxsize=2)
+    cache.put("emb", "a", [1.0])
+    cache.put("emb", "b", [2.0])
+
+    assert cache.get("other", "a") is None
+
+    cache.get("emb", "a")
+    cache.put("emb", "c", [3.0])
+
+    assert cache.get("emb", "a") == [1.0]
+    assert cache.get("emb", "b") is None
+    assert cache.get("emb", "c") == [3.0]
+
+
+def test_cache_size_zero_disables_it():
+    cache = EmbeddingCache(maxsize=0)
+    cache.put("emb", "a", [1.0])
+
+    assert cache.get("emb", "a") is None
+
+
+# -------------------------
+# Client embed()
+# -------------------------
+
+def test_sync_embed_sends_misses_in_batches_and_caches_them():
+    models = FakeModels()
+    client = sync_client(models, embedding_batch_size=2)
+
+    resp = client.embed(_request("a", "bb", "ccc", "dddd", "eeeee"))
+
+    assert resp.vectors == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+    assert models.embed_calls == [["a", "bb"], ["ccc", "dddd"], ["eeeee"]]
+    assert len(resp.raw["batches"]) == 3
+
+    resp = client.embed(_request("bb", "ffffff"))
+
+    assert resp.vectors == [[2.0], [6.0]]
+    assert models.embed_calls[-1] == ["ffffff"]
+
+
+def test_sync_embed_full_cache_hit_skips_the_provider():
+    models = FakeModels()
+    client = sync_client(models)
+    client.embed(_request("a", "bb"))
+
+    resp = client.embed(_request("bb", "a"))
+
+    assert resp.vectors == [[2.0], [1.0]]
+    assert resp.raw == {}
+    assert len(models.embed_calls) == 1
+
+
+def test_sync_embed_sends_repeated_texts_once_with_separate_copies():
+    models = FakeModels()
+    client = sync_client(models, embedding_cache_size=0)
+
+    resp = client.embed(_request("a", "bb", "a"))
+
+    assert models.embed_calls == [["a", "bb"]]
+    assert resp.vectors == [[1.0], [2.0], [1.0]]
+    assert resp.vectors[0] is not resp.vectors[2]
+
+
+def test_async_embed_batches_dedups_and_caches():
+    models = FakeAsyncModels()
+    client = async_client(models, embedding_batch_size=2)
+
+    resp = _embed_async(client, _request("a", "bb", "a", "ccc"))
+
+    assert sorted(models.embed_calls) == [["a", "bb"], ["ccc"]]
+    assert resp.vectors == [[1.0], [2.0], [1.0], [3.0]]
+    assert resp.vectors[0] is not resp.vectors[2]
+
+    resp = _embed_async(client, _request("ccc", "a"))
+
+    assert resp.vectors == [[3.0], [1.0]]
+    assert len(models.embed_calls) == 2
+
+
+# -------------------------
+# _BatchEmbedder
+# -------------------------
+
+def test_concurrent_embed_one_calls_share_one_request():
+    models = FakeAsyncModels()
+    client = async_client(models)
+
+    async def run():
+        try:
+            return await asyncio.gather(
+                client.embed_one("a", model="emb"),
+                client.embed_one("bb", model="emb"),
+                client.embed_one("ccc", model="emb"),
+            )
+        finally:
+            await client.aclose()
+
+    assert asyncio.run(run()) == [[1.0], [2.0], [3.0]]
+    assert models.embed_calls == [["a", "bb", "ccc"]]
+
+
+def test_batch_embedder_splits_by_max_batch_and_model():
+    calls: list[tuple[str, list[str]]] = []
+
+    async def embed(model: str, texts: list[str]) -> list[list[float]]:
+        calls.append((model, texts))
+        return [[float(len(t))] for t in texts]
+
+    async def run():
+        batcher = _BatchEmbedder(embed, max_batch=2)
+        try:
+            return await asyncio.gather(
+                batcher.submit("m1", "a"),
+                batcher.submit("m1", "bb"),
+                batcher.submit("m1", "ccc"),
+                batcher.submit("m2", "dddd"),
+            )
+        finally:
+            await batcher.aclose()
+
+    assert asyncio.run(run()) == [[1.0], [2.0], [3.0], [4.0]]
+    assert calls == [("m1", ["a", "bb"]), ("m1", ["ccc"]), ("m2", ["dddd"])]
+
+
+def test_batch_embedder_flushes_after_max_wait():
+    calls: list[list[str]] = []
+
+    async def embed(model: str, texts: list[str]) -> list[list[float]]:
+        calls.append(texts)
+        return [[0.0] for _ in texts]
+
+    async def run():
+        batcher = _BatchEmbedder(embed, max_batch=10, max_wait_ms=5)
+        try:
+            first = asyncio.create_task(batcher.submit("m", "a"))
+            await asyncio.sleep(0.05)
+            second = await batcher.submit("m", "b")
+            return await first, second
+        finally:
+            await batcher.aclose()
+
+    asyncio.run(run())
+    assert calls == [["a"], ["b"]]
+
+
+def test_batch_embedder_fails_every_caller_on_error():
+    async def embed(model: str, texts: list[str]) -> list[list[float]]:
+        raise RuntimeError("down")
+
+    async def run():
+        batcher = _BatchEmbedder(embed)
+        try:
+            return await asyncio.gather(
+                batcher.submit("m", "a"),
+                batcher.submit("m", "b"),
+                return_exceptions=True,
+            )
+        finally:
+            await batcher.aclose()
+
+    results = asyncio.run(run())
+    assert [type(r) for r in results] == [RuntimeError, RuntimeError]
+
+
+def test_aclose_fails_texts_waiting_in_a_partial_batch():
+    async def embed(model: str, texts: list[str]) -> list[list[float]]:
+        return [[0.0] for _ in texts]
+
+    async def run():
+        batcher = _BatchEmbedder(embed, max_wait_ms=200)
+        pending = asyncio.create_task(batcher.submit("m", "a"))
+        # Let _run take the text into its batch and start the wait window.
+        await asyncio.sleep(0.01)
+        await batcher.aclose()
+        return await asyncio.wait_for(asyncio.gather(pending, return_exceptions=True), 1)
+
+    [result] = asyncio.run(run())
+    assert isinstance(result, ProviderError)
+    assert result.message == "client closed"
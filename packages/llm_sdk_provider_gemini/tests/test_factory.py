@@ -0,0 +1,49 @@
+# ---------------------------------------------------------------------
+# Standard library
+# ---------------------------------------------------------------------
+import asyncio
+
+# ---------------------------------------------------------------------
+# Internal application imports
+# ---------------------------------------------------------------------
+from llm_sdk.settings import load_settings
+
+from llm_sdk_provider_gemini import AsyncGeminiLLMClient, GeminiProviderFactory, SyncGeminiClient
+
+
+def test_spec_describes_async_gemini_provider():
+    spec = GeminiProviderFactory().spec()
+
+    assert spec.name == "gemini"
+    assert spec.is_async
+    assert spec.supports_chat and spec.supports_embeddings and spec.supports_streaming
+
+
+def test_create_builds_async_client_from_default_settings():
+    client = GeminiProviderFactory().create(load_settings())
+
+    assert isinstance(client, AsyncGeminiLLMClient)
+    assert not client._response_cache.enabled
+    asyncio.run(client.aclose())
+
+
+def test_create_applies_response_cache_size_from_env(monkeypatch):
+    monkeypatch.setenv("LLM_SDK_GEMINI_RESPONSE_CACHE_SIZE", "8")
+
+    client = GeminiProviderFactory().create(load_settings())
+
+    assert client._response_cache.enabled
+    asyncio.run(client.aclose())
+
+
+def test_create_sync_applies_gemini_settings(monkeypatch):
+    monkeypatch.setenv("LLM_SDK_GEMINI_RESPONSE_CACHE_SIZE", "8")
+    monkeypatch.setenv("LLM_SDK_GEMINI_EMBEDDING_BATCH_SIZE", "7")
+
+    client = GeminiProviderFactory().create_sync(load_settings())
+
+    assert isinstance(client, SyncGeminiClient)
+    assert client._response_cache.enabled
+    assert client._embed_batch_size == 7
+    # Sync chunk merging stays off unless asked for.
+    assert client._stream_max_batch == 1
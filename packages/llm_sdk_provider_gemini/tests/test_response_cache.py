@@ -0,0 +1,90 @@
+# ---------------------------------------------------------------------
+# Standard library
+# ---------------------------------------------------------------------
+import asyncio
+
+# ---------------------------------------------------------------------
+# Internal application imports
+# ---------------------------------------------------------------------
+from llm_sdk.domain.chat import ChatMessage, ChatRequest, ChatResponse
+
+from llm_sdk_provider_gemini.response_cache import ResponseCache, request_key
+
+from fakes import FakeAsyncModels, FakeModels, async_client, sync_client
+
+
+def _request(text: str = "hola", **kwargs) -> ChatRequest:
+    return ChatRequest(model="m", messages=[ChatMessage(role="user", content=text)], **kwargs)
+
+
+def _response(text: str) -> ChatResponse:
+    return ChatResponse(model="m", content=text, usage=None, raw={})
+
+
+def test_request_key_covers_settings_and_messages():
+    base = request_key(_request())
+
+    assert request_key(_request()) == base
+    assert request_key(_request("adios")) != base
+    assert request_key(_request(temperature=0.5)) != base
+    assert request_key(_request(max_output_tokens=10)) != base
+    assert request_key(_request(output_schema={"type": "object"})) != base
+    assert request_key(
+        ChatRequest(model="m", messages=[ChatMessage(role="system", content="hola")])
+    ) != base
+
+
+def test_cache_evicts_least_recently_used():
+    cache = ResponseCache(maxsize=2)
+    cache.put(b"a", _response("a"))
+    cache.put(b"b", _response("b"))
+
+    cache.get(b"a")
+    cache.put(b"c", _response("c"))
+
+    assert cache.get(b"a").content == "a"
+    assert cache.get(b"b") is None
+    assert cache.get(b"c").content == "c"
+
+
+def test_cache_size_zero_disables_it():
+    cache = ResponseCache(maxsize=0)
+    cache.put(b"a", _response("a"))
+
+    assert not cache.enabled
+    assert cache.get(b"a") is None
+
+
+def test_sync_chat_answers_identical_requests_from_cache():
+    models = FakeModels(replies=["first", "second"])
+    client = sync_client(models, response_cache_size=8)
+
+    first = client.chat(_request())
+
+    assert client.chat(_request()) is first
+    assert client.chat(_request("adios")).content == "second"
+    assert models.generate_calls == 2
+
+
+def test_sync_chat_without_cache_calls_the_model_each_time():
+    models = FakeModels(replies=["first", "second"])
+    client = sync_client(models)
+
+    assert client.chat(_request()).content == "first"
+    assert client.chat(_request()).content == "second"
+
+
+def test_async_chat_answers_identical_requests_from_cache():
+    models = FakeAsyncModels(replies=["first", "second"])
+    client = async_client(models, response_cache_size=8)
+
+    async def run():
+        try:
+            return await client.chat(_request()), await client.chat(_request())
+        finally:
+            await client.aclose()
+
+    first, second = asyncio.run(run())
+
+    assert first is second
+    assert models.generate_calls == 1
@@ -0,0 +1,141 @@
+# ---------------------------------------------------------------------
+# Standard library
+# ---------------------------------------------------------------------
+import asyncio
+
+# ---------------------------------------------------------------------
+# Third-party libraries
+# ---------------------------------------------------------------------
+import pytest
+
+pytest.importorskip("numpy")
+
+# ---------------------------------------------------------------------
+# Internal application imports
+# ---------------------------------------------------------------------
+from llm_sdk.domain.chat import ChatMessage, ChatRequest, ChatResponse
+
+import llm_sdk_provider_gemini.semantic_cache as semantic_cache
+from llm_sdk_provider_gemini.semantic_cache import SemanticCache
+
+from fakes import FakeAsyncModels, async_client
+
+
+def _request(text: str) -> ChatRequest:
+    return ChatRequest(model="m", messages=[ChatMessage(role="user", content=text)])
+
+
+def _response(text: str) -> ChatResponse:
+    return ChatResponse(model="m", content=text, usage=None, raw={})
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(semantic_cache.time, "monotonic", clock)
+    return clock
+
+
+@pytest.mark.parametrize("quantize", [False, True])
+def test_lookup_returns_the_closest_entry_above_threshold(quantize):
+    cache = SemanticCache(threshold=0.95, quantize=quantize)
+    cache.store("ns", [1.0, 0.0, 0.0], _response("x"))
+    cache.store("ns", [0.0, 1.0, 0.0], _response("y"))
+
+    assert cache.lookup("ns", [2.0, 0.1, 0.0]).content == "x"
+    assert cache.lookup("ns", [0.1, 3.0, 0.0]).content == "y"
+    assert cache.lookup("ns", [1.0, 1.0, 0.0]) is None
+    assert cache.lookup("other", [1.0, 0.0, 0.0]) is None
+
+
+def test_int8_scores_match_float32():
+    np = pytest.importorskip("numpy")
+    rng = np.random.default_rng(0)
+    rows = rng.normal(size=(20, 64)).tolist()
+    query = rng.normal(size=64).tolist()
+
+    exact = SemanticCache(threshold=0.0)
+    quantized = SemanticCache(threshold=0.0, quantize=True)
+    for row in rows:
+        exact.store("ns", row, _response(""))
+        quantized.store("ns", row, _response(""))
+
+    ns = quantized._namespaces["ns"]
+    assert ns.vectors.dtype == np.int8
+    assert ns.scales.shape == (20,)
+
+    q = exact._normalize(query)
+    diff = exact._scores(exact._namespaces["ns"], q) - quantized._scores(ns, q)
+    assert float(np.abs(diff).max()) < 0.01
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = SemanticCache(threshold=0.9, ttl_s=10.0)
+    cache.store("ns", [1.0, 0.0], _response("old"))
+    clock.now += 5
+    cache.store("ns", [0.0, 1.0], _response("new"))
+
+    clock.now += 6
+    assert cache.lookup("ns", [1.0, 0.0]) is None
+    assert cache.lookup("ns", [0.0, 1.0]).content == "new"
+    assert len(cache._namespaces["ns"].responses) == 1
+
+    clock.now += 5
+    assert cache.lookup("ns", [0.0, 1.0]) is None
+
+
+@pytest.mark.parametrize("quantize", [False, True])
+def test_oldest_entries_are_dropped_past_max_entries(quantize):
+    cache = SemanticCache(threshold=0.9, max_entries=2, quantize=quantize)
+    cache.store("ns", [1.0, 0.0, 0.0], _response("a"))
+    cache.store("ns", [0.0, 1.0, 0.0], _response("b"))
+    cache.store("ns", [0.0, 0.0, 1.0], _response("c"))
+
+    ns = cache._namespaces["ns"]
+    assert [r.content for r in ns.responses] == ["b", "c"]
+    assert len(ns.vectors) == 2
+    assert cache.lookup("ns", [1.0, 0.0, 0.0]) is None
+
+
+def test_chat_answers_similar_prompt_from_semantic_cache():
+    models = FakeAsyncModels(replies=["first", "second"])
+    client = async_client(models, semantic_cache=SemanticCache(threshold=0.99))
+
+    async def run():
+        try:
+            first = await client.chat(_request("hola"))
+            # Same length, so the fake embeds it to the same vector.
+            second = await client.chat(_request("hole"))
+            return first, second
+        finally:
+            await client.aclose()
+
+    first, second = asyncio.run(run())
+
+    assert first is second
+    assert models.generate_calls == 1
+
+
+def test_chat_answers_from_model_when_semantic_lookup_fails():
+    models = FakeAsyncModels(replies=["fresh"], embed_error=RuntimeError("embed down"))
+    client = async_client(models, semantic_cache=SemanticCache(threshold=0.9))
+
+    async def run():
+        try:
+            return await client.chat(_request("hola"))
+        finally:
+            await client.aclose()
+
+    resp = asyncio.run(run())
+
+    assert resp.content == "fresh"
+    assert models.generate_calls == 1
@@ -0,0 +1,146 @@
+# ---------------------------------------------------------------------
+# Standard library
+# ---------------------------------------------------------------------
+import asyncio
+from types import SimpleNamespace
+
+# ---------------------------------------------------------------------
+# Third-party libraries
+# ---------------------------------------------------------------------
+import pytest
+
+# ---------------------------------------------------------------------
+# Internal application imports
+# ---------------------------------------------------------------------
+from llm_sdk.domain.chat import ChatMessage, ChatRequest
+
+import llm_sdk_provider_gemini.sync_client as sync_module
+from llm_sdk_provider_gemini.async_client import _batched as async_batched
+from llm_sdk_provider_gemini.sync_client import _batched as sync_batched
+
+from fakes import FakeAsyncModels, FakeModels, async_client, sync_client
+
+
+def _chunk(text: str | None, total: int | None = None) -> SimpleNamespace:
+    usage = SimpleNamespace(
+        prompt_token_count=1 if total else None,
+        candidates_token_count=None,
+        total_token_count=total,
+        thoughts_token_count=None,
+    )
+    return SimpleNamespace(text=text, usage_metadata=usage if total else None)
+
+
+def _request() -> ChatRequest:
+    return ChatRequest(model="m", messages=[ChatMessage(role="user", content="hola")])
+
+
+# -------------------------
+# Sync _batched
+# -------------------------
+
+def test_sync_batches_grow_by_three_up_to_max_batch():
+    batches = list(sync_batched(iter(range(20)), flush_s=60.0, max_batch=5))
+
+    assert [len(b) for b in batches] == [1, 3, 5, 5, 5, 1]
+    assert [x for b in batches for x in b] == list(range(20))
+
+
+def test_sync_batch_is_flushed_once_the_window_has_passed(monkeypatch: pytest.MonkeyPatch):
+    # Arrival times of items 0..5; the window is 1s.
+    times = iter([0.0, 0.1, 0.2, 1.5, 1.6, 1.7])
+    monkeypatch.setattr(sync_module.time, "monotonic", lambda: next(times))
+
+    batches = list(sync_batched(iter(range(6)), flush_s=1.0, max_batch=50))
+
+    # [0] by size; [1, 2, 3] by size (target 3); [4, 5] left at the end.
+    assert batches == [[0], [1, 2, 3], [4, 5]]
+
+    times = iter([0.0, 0.1, 0.2, 1.5, 1.6])
+    batches = list(sync_batched(iter(range(5)), flush_s=1.0, max_batch=50))
+
+    assert batches == [[0], [1, 2, 3], [4]]
+
+    # Item 2 arrives after the window opened by item 1 has passed.
+    times = iter([0.0, 0.1, 1.5, 1.6])
+    batches = list(sync_batched(iter(range(4)), flush_s=1.0, max_batch=50))
+
+    assert batches == [[0], [1, 2], [3]]
+
+
+def test_sync_stream_chat_coalesces_chunks():
+    chunks = [_chunk("a"), _chunk("b"), _chunk(None), _chunk("c"), _chunk("d", total=7)]
+    client = sync_client(FakeModels(stream=chunks), stream_flush_ms=60_000, stream_max_batch=50)
+
+    events = list(client.stream_chat(_request()))
+
+    assert [e.delta for e in events] == ["a", "bc", "d", ""]
+    assert [e.done for e in events] == [False, False, False, True]
+    assert events[-1].usage.total_tokens == 7
+
+
+def test_sync_stream_chat_emits_each_chunk_by_default():
+    chunks = [_chunk("a"), _chunk("b"), _chunk("c")]
+    client = sync_client(FakeModels(stream=chunks))
+
+    assert [e.delta for e in client.stream_chat(_request())] == ["a", "b", "c", ""]
+
+
+# -------------------------
+# Async _batched
+# -------------------------
+
+async def _collect(stream, flush_s: float, max_batch: int) -> list[list[int]]:
+    return [b async for b in async_batched(stream, flush_s, max_batch)]
+
+
+async def _items(delays: list[float]):
+    for i, delay in enumerate(delays):
+        await asyncio.sleep(delay)
+        yield i
+
+
+def test_async_batches_grow_by_three_up_to_max_batch():
+    batches = asyncio.run(_collect(_items([0.0] * 20), flush_s=60.0, max_batch=5))
+
+    assert [len(b) for b in batches] == [1, 3, 5, 5, 5, 1]
+    assert [x for b in batches for x in b] == list(range(20))
+
+
+def test_async_partial_batch_is_flushed_by_timer():
+    async def run():
+        loop = asyncio.get_running_loop()
+        flushed: list[tuple[list[int], float]] = []
+        start = loop.time()
+        async for batch in async_batched(_items([0.0, 0.0, 0.5]), 0.05, 50):
+            flushed.append((batch, loop.time() - start))
+        return flushed
+
+    flushed = asyncio.run(run())
+
+    assert [b for b, _ in flushed] == [[0], [1], [2]]
+    # Item 1 waits for the flush window, not for item 2.
+    assert flushed[1][1] < 0.4
+
+
+def test_async_flush_timeout_does_not_cancel_the_stream():
+    batches = asyncio.run(_collect(_items([0.0, 0.0, 0.02, 0.02, 0.02]), 0.01, 50))
+
+    assert [x for b in batches for x in b] == [0, 1, 2, 3, 4]
+
+
+def test_async_stream_chat_coalesces_chunks():
+    chunks = [_chunk("a"), _chunk("b"), _chunk("c"), _chunk("d", total=7)]
+    client = async_client(FakeAsyncModels(stream=chunks), stream_flush_ms=60_000)
+
+    async def run():
+        try:
+            return [e async for e in client.stream_chat(_request())]
+        finally:
+            await client.aclose()
+
+    events = asyncio.run(run())
+
+    assert [e.delta for e in events] == ["a", "bcd", ""]
+    assert events[-1].done
+    assert events[-1].usage.total_tokens == 7